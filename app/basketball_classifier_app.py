@@ -8,13 +8,13 @@ import os
 import sys
 import time
 import threading
+from collections import deque
 import numpy as np
 import onnxruntime as ort
-from PIL import Image, ImageGrab
 import cv2
 import PyQt5.QtCore as QtCore
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QImage, QPixmap, QFont, QColor, QPainter, QPen
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPixmap, QFont
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, 
                            QVBoxLayout, QHBoxLayout, QWidget, 
                            QPushButton, QProgressBar, QSlider, QCheckBox)
@@ -28,20 +28,58 @@ from fluid_animation import FluidAnimation
 # Import settings dialog
 from settings import SettingsDialog
 
-# Import overlay
-from overlay import ClassifierOverlay
-
 # Import volume controller
 from functionality import VolumeController
 
+# Import screen capture worker
+from capture import CaptureWorker
+
+# Import scene change detection
+from scene import SCENE_THRESHOLD, scene_thumbnail, scene_change
+
+# Frames stay in the BGRA layout mss captures them in. The display path shows
+# them as QImage.Format_RGB32 (same bytes on little-endian) and the only colour
+# conversion is BGRA->RGB on the 224x224 model input, so don't add swaps elsewhere.
+
 # Constants
 MODEL_PATH = os.path.abspath("models/hypernetwork_basketball_classifier.onnx")
+MODEL_PATH_FP16 = os.path.abspath("models/hypernetwork_basketball_classifier_fp16.onnx")  # optional, GPU only
+MODEL_PATH_INT8 = os.path.abspath("models/hypernetwork_basketball_classifier_int8.onnx")  # optional, CPU only
 TARGET_SIZE = 224
+INPUT_BATCH_DIM = "unk__1406"  # symbolic batch dimension name in the exported model input
 CAPTURE_INTERVAL = 500  # ms
-SCENE_THRESHOLD = 30.0  # threshold for scene change detection
+SCENE_CHANGE_BORDER = (62, 62, 255, 255)  # BGRA frame border colours
+IDLE_BORDER = (100, 100, 100, 255)
+DUPLICATE_HASH_DISTANCE = 3  # model inputs whose dHashes differ in fewer bits reuse the last prediction
 FPS_UPDATE_INTERVAL = 1000  # ms
+MIN_INFERENCE_INTERVAL = CAPTURE_INTERVAL / 2000  # s, half the capture interval to tolerate timer jitter
 HISTORY_SIZE = 4  # Number of predictions to keep in history
 MIN_CONSENSUS_CONFIDENCE = 65.0  # Minimum confidence level for strong consensus
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".adentify_cache")  # optimized models and engines
+GPU_PROVIDERS = ('TensorrtExecutionProvider', 'CUDAExecutionProvider', 'DmlExecutionProvider')
+ORT_LOG_SEVERITY = 2  # 0=verbose .. 3=error; use 1 to see node placement / memcpy warnings
+TRT_CACHE_PATH = os.path.join(CACHE_DIR, "trt")  # TensorRT engine/timing cache directory
+
+# Label styles applied on every prediction; built once and only re-applied
+# when they change, since each setStyleSheet re-parses and restyles the widget
+PREDICTION_STYLE_BB = f"color: {RED_COLOR}; font-size: 10pt;"
+PREDICTION_STYLE_NB = f"color: {LIGHT_TEXT_COLOR}; font-size: 10pt;"
+CONSENSUS_STYLE_BB_STRONG = f"color: {RED_COLOR}; font-size: 11pt; font-weight: bold;"
+CONSENSUS_STYLE_NB_STRONG = f"color: {LIGHT_TEXT_COLOR}; font-size: 11pt; font-weight: bold;"
+CONSENSUS_STYLE_BB_WEAK = f"color: {RED_COLOR}; font-size: 11pt; font-style: italic;"
+CONSENSUS_STYLE_NB_WEAK = f"color: {LIGHT_TEXT_COLOR}; font-size: 11pt; font-style: italic;"
+
+def set_style(widget, style):
+    """Apply a stylesheet only if it differs from the one already set"""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+def set_prediction_state(label, state):
+    """Switch a label between the QLabel[prediction=...] rules in STYLE, re-polishing only on change"""
+    if label.property("prediction") != state:
+        label.setProperty("prediction", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
 
 class BasketballClassifierApp(QMainWindow):
     def __init__(self):
@@ -49,12 +87,19 @@ class BasketballClassifierApp(QMainWindow):
         self.setWindowTitle("Basketball Classifier")
         self.setMinimumSize(900, 600)
         self.model = None
+        self.inference_lock = threading.Lock()
         self.running = False
-        self.last_frame = None
-        self.prev_frame = None
+        self.capture_session = 0  # Bumped on every start/stop so stale predictions can be dropped
+        self.last_small = None  # Downsampled frames used for scene detection
+        self.prev_small = None
+        self.last_input_hash = None  # dHash of the last model input and the prediction it produced
+        self.last_pred_value = None
+        self.capture_size = None  # (w, h) of the frames the display buffer was sized for
+        self.display_buffer = None  # Reused BGRA display frame
+        self.display_image = None  # QImage wrapping display_buffer
         self.fps_count = 0
         self.fps = 0
-        self.last_fps_update = time.time()
+        self.last_fps_update = time.monotonic_ns()
         self.scene_change_threshold = SCENE_THRESHOLD
         self.overlay_mode = False
         
@@ -63,15 +108,21 @@ class BasketballClassifierApp(QMainWindow):
         self.volume_control_enabled = True
         
         # Prediction history tracking
-        self.prediction_history = []  # List of (is_basketball, confidence) tuples
+        self.prediction_history = deque(maxlen=HISTORY_SIZE)  # (is_basketball, confidence) tuples, newest first
         self.history_labels = []  # List of QLabel widgets for history display
         self.consensus_prediction = None  # The stable consensus prediction
         self.consensus_confidence = 0.0  # Confidence in the consensus
         
-        # Create overlay
-        self.overlay = ClassifierOverlay()
-        self.overlay.exitOverlay.connect(self.exit_overlay_mode)
-        self.overlay.toggle_button.clicked.connect(self.overlay_toggle_capture)
+        # Overlay window, created the first time overlay mode is entered
+        self.overlay = None
+        self.last_overlay_prediction = None  # (is_basketball, rounded confidence) last shown on it
+        
+        # Screen capture runs on its own thread and hands frames to process_frame
+        self.capture_thread = QtCore.QThread()
+        self.capture_worker = CaptureWorker()
+        self.capture_worker.moveToThread(self.capture_thread)
+        self.capture_worker.frameReady.connect(self.process_frame)
+        self.capture_thread.start()
         
         # Center the window
         self.center_on_screen()
@@ -84,6 +135,15 @@ class BasketballClassifierApp(QMainWindow):
         self.load_model_thread.daemon = True
         self.load_model_thread.start()
         
+        # A single long-lived thread runs inference on the latest pending frame;
+        # a newer frame replaces one still waiting instead of piling up behind it
+        self.pending_frames = deque(maxlen=1)  # (capture_session, frame) tuples
+        self.frame_pending = threading.Event()
+        self.last_inference_time = 0.0  # time.monotonic() of the last inference the worker started
+        self.inference_thread = threading.Thread(target=self.inference_loop)
+        self.inference_thread.daemon = True
+        self.inference_thread.start()
+        
         # Apply style
         self.setStyleSheet(STYLE)
 
@@ -256,10 +316,6 @@ class BasketballClassifierApp(QMainWindow):
         # Add both screens to main layout
         self.main_layout.addWidget(self.loading_widget)
         self.main_layout.addWidget(self.main_widget)
-        
-        # Setup timer for captures
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.process_frame)
 
     def toggle_volume_control(self, enabled):
         """Enable or disable volume control functionality"""
@@ -279,25 +335,147 @@ class BasketballClassifierApp(QMainWindow):
 
     def load_model(self):
         try:
-            # Simulate longer loading for UX purposes
-            time.sleep(1.5)
+            # Preprocessing works on small images, so keep OpenCV's pool small
+            # rather than letting it compete with ORT for every core
+            cv2.setUseOptimized(True)
+            cv2.setNumThreads(2)
             
             # Initialize ONNX Runtime session
             sess_options = ort.SessionOptions()
             sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
-            
-            # Try to use GPU if available
-            providers = ['CUDAExecutionProvider', 'CPUExecutionProvider']
-            self.model = ort.InferenceSession(MODEL_PATH, sess_options, providers=providers)
-            
-            # Get model input name
-            self.input_name = self.model.get_inputs()[0].name
+            sess_options.log_severity_level = ORT_LOG_SEVERITY
+            
+            # Batch-1 inference has no branch parallelism worth a parallel executor;
+            # bound the intra-op pool so CPU fallback leaves room for capture and UI
+            sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+            sess_options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+            # Inference runs at most a few times a second, so don't let idle pool
+            # threads busy-wait for work between runs
+            sess_options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+            
+            # Frames are always classified one at a time, so pin the batch
+            # dimension and let ORT plan memory and kernels for a static shape
+            sess_options.add_free_dimension_override_by_name(INPUT_BATCH_DIM, 1)
+            
+            # Prefer TensorRT, then CUDA, then DirectML (any DirectX 12 GPU on
+            # Windows, including integrated ones), then CPU - keeping only the
+            # providers this onnxruntime build actually ships with
+            providers = [
+                ('TensorrtExecutionProvider', {
+                    'trt_fp16_enable': True,
+                    'trt_engine_cache_enable': True,
+                    'trt_engine_cache_path': TRT_CACHE_PATH,
+                    'trt_timing_cache_enable': True,
+                }),
+                # Heuristic cuDNN algo search avoids the EXHAUSTIVE benchmark
+                # on first run, which is slow and rarely wins at batch size 1
+                ('CUDAExecutionProvider', {
+                    'device_id': 0,
+                    'arena_extend_strategy': 'kNextPowerOfTwo',
+                    'cudnn_conv_algo_search': 'DEFAULT',
+                    'do_copy_in_default_stream': True,
+                }),
+                ('DmlExecutionProvider', {
+                    'device_id': 0,
+                }),
+                'CPUExecutionProvider',
+            ]
+            available_providers = ort.get_available_providers()
+            providers = [p for p in providers
+                         if (p[0] if isinstance(p, tuple) else p) in available_providers]
+            
+            # Use the half precision model when it has been generated and a GPU
+            # provider can take advantage of it, or the INT8 one when running on CPU
+            model_path = MODEL_PATH
+            gpu_available = any(p in available_providers for p in GPU_PROVIDERS)
+            if gpu_available and os.path.exists(MODEL_PATH_FP16):
+                model_path = MODEL_PATH_FP16
+            elif not gpu_available and os.path.exists(MODEL_PATH_INT8):
+                model_path = MODEL_PATH_INT8
+            
+            # Reuse the graph ORT optimized on a previous run instead of optimizing
+            # again on every startup. TensorRT builds (and caches) its own engines
+            # and its compiled nodes can't be serialized, so it is left out.
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            primary_provider = providers[0][0] if isinstance(providers[0], tuple) else providers[0]
+            if primary_provider == 'DmlExecutionProvider':
+                # DirectML doesn't support memory pattern planning
+                sess_options.enable_mem_pattern = False
+            session = None
+            if primary_provider != 'TensorrtExecutionProvider':
+                # Optimizations are provider and onnxruntime version specific, so
+                # cache one graph per provider and version
+                model_name = os.path.splitext(os.path.basename(model_path))[0]
+                optimized_path = os.path.join(
+                    CACHE_DIR, f"{model_name}.{primary_provider}.ort{ort.__version__}.opt.onnx")
+                if (os.path.exists(optimized_path) and
+                        os.path.getmtime(optimized_path) >= os.path.getmtime(model_path)):
+                    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+                    try:
+                        session = ort.InferenceSession(optimized_path, sess_options, providers=providers)
+                    except Exception as e:
+                        # Truncated or otherwise unreadable; rebuild it from the source model
+                        print(f"Discarding cached optimized model {optimized_path}: {e}")
+                        os.remove(optimized_path)
+                        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                if session is None:
+                    sess_options.optimized_model_filepath = optimized_path
+            
+            if session is None:
+                session = ort.InferenceSession(model_path, sess_options, providers=providers)
+            self.model = session
+            
+            # Get model input name and element type (float16 if the FP16 model was converted without keep_io_types)
+            model_input = self.model.get_inputs()[0]
+            self.input_name = model_input.name
+            input_dtype = np.float16 if model_input.type == 'tensor(float16)' else np.float32
+            
+            # Cache the provider ORT actually selected (highest priority one that loaded)
+            self.active_provider = self.model.get_providers()[0]
+            on_gpu = self.active_provider in GPU_PROVIDERS
+            provider_name = self.active_provider.replace('ExecutionProvider', '')
+            provider_status = f"{'GPU' if on_gpu else 'CPU'} - {provider_name}"
+            
+            # Bind a persistent input buffer (and keep the output on the device)
+            # so each inference reuses the same memory instead of handing ORT a
+            # freshly allocated array to copy
+            # DirectML takes host buffers and uploads them itself
+            self.input_device = ('cuda' if self.active_provider in
+                                 ('TensorrtExecutionProvider', 'CUDAExecutionProvider') else 'cpu')
+            self.resize_buffer = np.empty((TARGET_SIZE, TARGET_SIZE, 4), dtype=np.uint8)
+            self.input_buffer = np.zeros((1, TARGET_SIZE, TARGET_SIZE, 3), dtype=input_dtype)
+            self.input_ortvalue = ort.OrtValue.ortvalue_from_numpy(self.input_buffer, self.input_device, 0)
+            self.io_binding = self.model.io_binding()
+            self.io_binding.bind_ortvalue_input(self.input_name, self.input_ortvalue)
+            model_output = self.model.get_outputs()[0]
+            if self.input_device != 'cpu':
+                self.output_buffer = None
+                self.io_binding.bind_output(model_output.name, self.input_device)
+            else:
+                # With host buffers ORT can write the (1, 1) prediction straight into a
+                # preallocated array, so nothing is allocated or copied per run
+                output_dtype = np.float16 if model_output.type == 'tensor(float16)' else np.float32
+                self.output_buffer = np.zeros((1, 1), dtype=output_dtype)
+                self.io_binding.bind_ortvalue_output(
+                    model_output.name, ort.OrtValue.ortvalue_from_numpy(self.output_buffer))
+            
+            # Warm up the preprocessing and the session so the first real frame
+            # doesn't pay for OpenCV/NumPy first-call setup or for TensorRT engine
+            # building / kernel selection. The second run covers allocations ORT
+            # defers until the first run has planned memory
+            dummy_frame = np.zeros((TARGET_SIZE * 2, TARGET_SIZE * 2, 4), dtype=np.uint8)
+            cv2.resize(dummy_frame, (TARGET_SIZE, TARGET_SIZE), dst=self.resize_buffer,
+                       interpolation=cv2.INTER_AREA)
+            self._dhash(self.resize_buffer)
+            self.input_buffer[0] = self.resize_buffer[..., 2::-1]
+            for _ in range(2):
+                self._run_model()
             
             # Update UI in main thread
             QtCore.QMetaObject.invokeMethod(
                 self, "model_loaded", Qt.QueuedConnection,
                 QtCore.Q_ARG(bool, True),
-                QtCore.Q_ARG(str, "GPU" if 'CUDAExecutionProvider' in self.model.get_providers() else "CPU")
+                QtCore.Q_ARG(str, provider_status)
             )
         except Exception as e:
             # Update UI to show error
@@ -331,36 +509,41 @@ class BasketballClassifierApp(QMainWindow):
         if not self.running:
             # Start capture
             self.running = True
+            self.capture_session += 1
+            self.pending_frames.clear()
             self.start_button.setText("Stop Capture")
             
             # Reset frame detection state
-            self.last_frame = None
-            self.prev_frame = None
+            self.last_small = None
+            self.prev_small = None
+            self.last_input_hash = None
             
             # Reset prediction history and consensus
-            self.prediction_history = []
+            self.prediction_history.clear()
             self.consensus_prediction = None
             self.consensus_confidence = 0.0
             
             for label in self.history_labels:
                 label.setText("N/A")
-                label.setStyleSheet("")
+                set_prediction_state(label, "")
             
             # Hide fluid animation and show video frame
             self.fluid_animation.stop_animation()
             self.fluid_animation.hide()
             self.video_frame.show()
             
-            # Force an immediate frame capture and classification
-            self.immediate_process_frame()
-            
-            # Then start the regular timer
-            self.timer.start(CAPTURE_INTERVAL)
+            # Capture and classify a frame immediately, then keep capturing on the worker's timer
+            QtCore.QMetaObject.invokeMethod(
+                self.capture_worker, "start", Qt.QueuedConnection,
+                QtCore.Q_ARG(int, CAPTURE_INTERVAL)
+            )
         else:
             # Stop capture
             self.running = False
+            self.capture_session += 1
+            self.pending_frames.clear()
             self.start_button.setText("Start Capture")
-            self.timer.stop()
+            QtCore.QMetaObject.invokeMethod(self.capture_worker, "stop", Qt.QueuedConnection)
             
             # Switch to fluid animation
             self.video_frame.hide()
@@ -369,10 +552,10 @@ class BasketballClassifierApp(QMainWindow):
             
             # Reset prediction info
             self.prediction_label.setText("Current Frame: N/A")
-            self.prediction_label.setStyleSheet(f"color: {LIGHT_TEXT_COLOR}; font-size: 10pt;")
+            set_style(self.prediction_label, PREDICTION_STYLE_NB)
             self.confidence_label.setText("Confidence: 0%")
             self.consensus_label.setText("CONSENSUS: N/A")
-            self.consensus_label.setStyleSheet(f"color: {LIGHT_TEXT_COLOR}; font-size: 11pt; font-weight: bold;")
+            set_style(self.consensus_label, CONSENSUS_STYLE_NB_STRONG)
             self.model_status_label.setText("Model Status: Idle")
             
             # Restore volume when stopping
@@ -384,36 +567,27 @@ class BasketballClassifierApp(QMainWindow):
         if not self.prediction_history:
             return None, 0.0
         
-        # Count basketball and non-basketball predictions
-        basketball_count = sum(1 for is_bb, _ in self.prediction_history if is_bb)
-        not_basketball_count = len(self.prediction_history) - basketball_count
+        # History as arrays, newest first
+        history = np.array(self.prediction_history, dtype=np.float64)
+        is_bb = history[:, 0] > 0.5
+        conf = history[:, 1]
         
         # Calculate weights based on:
         # 1. Recency (newer predictions have more weight)
         # 2. Confidence magnitude (high and low confidences have more weight than mid-range)
-        recency_weights = [max(0.5, 1.0 - 0.15 * i) for i in range(len(self.prediction_history))]
-        
-        basketball_confidence = 0.0
-        not_basketball_confidence = 0.0
-        effective_bb_count = 0
-        effective_not_bb_count = 0
-        
-        for i, (is_bb, conf) in enumerate(self.prediction_history):
-            # Calculate confidence magnitude weight
-            # - Predictions close to 0.5 get reduced weight (uncertain)
-            # - Predictions close to 0 or 1 get increased weight (certain)
-            confidence_certainty = abs(conf - 0.5) * 2  # 0.0 for conf=0.5, 1.0 for conf=0 or 1
-            confidence_weight = 0.5 + confidence_certainty  # Range from 0.5 to 1.5
-            
-            # Combine recency and confidence weights
-            combined_weight = recency_weights[i] * confidence_weight
-            
-            if is_bb:
-                basketball_confidence += combined_weight * conf
-                effective_bb_count += combined_weight
-            else:
-                not_basketball_confidence += combined_weight * (1.0 - conf)
-                effective_not_bb_count += combined_weight
+        recency_weights = np.maximum(0.5, 1.0 - 0.15 * np.arange(len(conf)))
+        
+        # - Predictions close to 0.5 get reduced weight (uncertain)
+        # - Predictions close to 0 or 1 get increased weight (certain)
+        confidence_weights = 0.5 + np.abs(conf - 0.5) * 2  # Range from 0.5 to 1.5
+        combined_weights = recency_weights * confidence_weights
+        
+        bb_weights = combined_weights[is_bb]
+        not_bb_weights = combined_weights[~is_bb]
+        effective_bb_count = float(bb_weights.sum())
+        effective_not_bb_count = float(not_bb_weights.sum())
+        basketball_confidence = float(bb_weights @ conf[is_bb])
+        not_basketball_confidence = float(not_bb_weights @ (1.0 - conf[~is_bb]))
         
         # Normalize confidences
         if effective_bb_count > 0:
@@ -442,7 +616,7 @@ class BasketballClassifierApp(QMainWindow):
         confidences = []
         is_consensus = self.consensus_prediction
         
-        for is_bb, conf in self.prediction_history[:2]:
+        for is_bb, conf in (self.prediction_history[0], self.prediction_history[1]):
             if is_bb == is_consensus:
                 confidences.append(conf)
             else:
@@ -460,48 +634,6 @@ class BasketballClassifierApp(QMainWindow):
         else:
             return "decreasing"
 
-    def immediate_process_frame(self):
-        """Process a frame immediately without waiting for the timer"""
-        try:
-            # Capture screen
-            screen = ImageGrab.grab()
-            
-            # Convert to numpy array
-            frame = np.array(screen)
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            
-            # Resize for display while preserving aspect ratio
-            h, w, _ = frame.shape
-            ratio = min(780 / w, 380 / h)
-            display_frame = cv2.resize(frame, (int(w * ratio), int(h * ratio)))
-            
-            # Initialize frame detection state
-            self.last_frame = display_frame.copy()
-            self.prev_frame = display_frame.copy()
-            
-            # Prepare for display
-            display_img = QImage(display_frame.data, display_frame.shape[1], display_frame.shape[0], 
-                              display_frame.strides[0], QImage.Format_RGB888).rgbSwapped()
-            
-            # Add info overlay with processing indicator
-            pixmap = QPixmap.fromImage(display_img)
-            painter = QPainter(pixmap)
-            painter.setPen(QPen(QColor(255, 62, 62), 3))  # Always use processing indicator for immediate frame
-            painter.drawRect(5, 5, pixmap.width() - 10, pixmap.height() - 10)
-            painter.end()
-            
-            self.video_frame.setPixmap(pixmap)
-            
-            # Always run inference on the immediate frame
-            if self.model is not None:
-                # Run in the current thread for immediate feedback
-                self.run_inference(frame)
-            
-        except Exception as e:
-            import traceback
-            print(f"Error in immediate frame capture: {e}")
-            print(traceback.format_exc())
-
     def open_settings(self):
         """Open the settings dialog"""
         dialog = SettingsDialog(self, self.scene_change_threshold, self.fps)
@@ -510,35 +642,54 @@ class BasketballClassifierApp(QMainWindow):
             self.scene_change_threshold = dialog.get_threshold()
             print(f"Scene sensitivity updated to: {self.scene_change_threshold}")
 
-    def process_frame(self):
+    @QtCore.pyqtSlot(object)
+    def process_frame(self, frame):
+        """Display a captured BGRA frame and classify it if the scene changed"""
+        # Frames captured just before stopping may still be queued
+        if not self.running:
+            return
+        
         try:
-            # Capture screen
-            screen = ImageGrab.grab()
-            
-            # Convert to numpy array
-            frame = np.array(screen)
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+            # Capture and inference keep running while minimized or in overlay
+            # mode (they drive the volume control), but nobody sees the preview
+            render_needed = self.isVisible() and not self.isMinimized() and self.video_frame.isVisible()
+            
+            if render_needed:
+                # (Re)allocate the display buffer and the QImage wrapping it only
+                # when the capture size changes
+                h, w, _ = frame.shape
+                if self.capture_size != (w, h):
+                    ratio = min(780 / w, 380 / h)
+                    display_w, display_h = int(w * ratio), int(h * ratio)
+                    self.display_buffer = np.empty((display_h, display_w, 4), dtype=np.uint8)
+                    self.display_image = QImage(self.display_buffer.data, display_w, display_h,
+                                                self.display_buffer.strides[0], QImage.Format_RGB32)
+                    self.capture_size = (w, h)
+                
+                # Resize for display while preserving aspect ratio
+                display_frame = self.display_buffer
+                cv2.resize(frame, (display_frame.shape[1], display_frame.shape[0]), dst=display_frame,
+                           interpolation=cv2.INTER_AREA)
+                thumbnail_source = display_frame
+            else:
+                thumbnail_source = frame
             
-            # Resize for display while preserving aspect ratio
-            h, w, _ = frame.shape
-            ratio = min(780 / w, 380 / h)
-            display_frame = cv2.resize(frame, (int(w * ratio), int(h * ratio)))
+            # Scene detection only needs a global statistic, so compare small
+            # single-channel luminance thumbnails
+            small_frame = scene_thumbnail(thumbnail_source)
             
             # Store for scene detection
-            if self.last_frame is None:
-                self.last_frame = display_frame
-                self.prev_frame = display_frame
+            if self.last_small is None:
+                self.last_small = small_frame
+                self.prev_small = small_frame
                 should_process = True
                 print("Initial frame captured")
             else:
                 # Scene change detection based on frame difference
-                self.prev_frame = self.last_frame
-                self.last_frame = display_frame
+                self.prev_small = self.last_small
+                self.last_small = small_frame
                 
-                # Calculate frame difference
-                frame_diff = cv2.absdiff(self.prev_frame, self.last_frame)
-                frame_diff = cv2.cvtColor(frame_diff, cv2.COLOR_BGR2GRAY)
-                frame_change = np.mean(frame_diff)
+                frame_change = scene_change(self.prev_small, self.last_small)
                 
                 # Only process if significant change is detected
                 should_process = frame_change > self.scene_change_threshold
@@ -546,64 +697,106 @@ class BasketballClassifierApp(QMainWindow):
                 if should_process:
                     print(f"Scene change detected: {frame_change:.2f} > {self.scene_change_threshold}")
             
-            # Update FPS counter
+            # Update FPS counter (integer nanoseconds, label only touched on change)
             self.fps_count += 1
-            current_time = time.time()
+            current_time = time.monotonic_ns()
             time_diff = current_time - self.last_fps_update
             
-            if time_diff >= FPS_UPDATE_INTERVAL / 1000:
-                self.fps = int(self.fps_count / time_diff)
-                self.fps_label.setText(f"FPS: {self.fps}")
+            if time_diff >= FPS_UPDATE_INTERVAL * 1_000_000:
+                self.fps = self.fps_count * 1_000_000_000 // time_diff
+                fps_text = f"FPS: {self.fps}"
+                if render_needed and self.fps_label.text() != fps_text:
+                    self.fps_label.setText(fps_text)
                 self.fps_count = 0
                 self.last_fps_update = current_time
             
-            # Prepare for display
-            display_img = QImage(display_frame.data, display_frame.shape[1], display_frame.shape[0], 
-                              display_frame.strides[0], QImage.Format_RGB888).rgbSwapped()
-            
-            # Add info overlay
-            pixmap = QPixmap.fromImage(display_img)
-            painter = QPainter(pixmap)
-            
-            # Draw scene change indicator
-            if should_process:
-                painter.setPen(QPen(QColor(255, 62, 62), 3))
-            else:
-                painter.setPen(QPen(QColor(100, 100, 100), 3))
-            
-            painter.drawRect(5, 5, pixmap.width() - 10, pixmap.height() - 10)
-            painter.end()
-            
-            self.video_frame.setPixmap(pixmap)
+            if render_needed:
+                # Draw the scene change indicator straight into the display buffer
+                # (after the thumbnail was taken) instead of painting on the pixmap
+                cv2.rectangle(display_frame, (5, 5),
+                              (display_frame.shape[1] - 5, display_frame.shape[0] - 5),
+                              SCENE_CHANGE_BORDER if should_process else IDLE_BORDER, 3)
+                
+                # display_image already wraps the resized pixels
+                self.video_frame.setPixmap(QPixmap.fromImage(self.display_image))
             
-            # Only run inference if scene changed significantly
+            # Only run inference if scene changed significantly. Always hand the
+            # frame over: the worker paces itself and keeps only the newest one
             if should_process and self.model is not None:
-                threading.Thread(target=self.run_inference, args=(frame,)).start()
+                self.pending_frames.append((self.capture_session, frame))
+                self.frame_pending.set()
 
         except Exception as e:
             import traceback
-            print(f"Error capturing screen: {e}")
+            print(f"Error processing frame: {e}")
             print(traceback.format_exc())
 
-    def run_inference(self, frame):
+    def _run_model(self):
+        """Run the session on the current contents of the bound input buffer"""
+        if self.input_device != 'cpu':
+            # CPU OrtValues share memory with input_buffer; device ones need an upload
+            self.input_ortvalue.update_inplace(self.input_buffer)
+        self.model.run_with_iobinding(self.io_binding)
+        if self.output_buffer is not None:
+            return self.output_buffer
+        return self.io_binding.copy_outputs_to_cpu()[0]
+
+    def inference_loop(self):
+        """Run inference on frames handed over by process_frame"""
+        while True:
+            self.frame_pending.wait()
+            # Queued capture signals can arrive back to back under load; wait out
+            # the interval so frames handed over meanwhile collapse into the newest
+            delay = self.last_inference_time + MIN_INFERENCE_INTERVAL - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.frame_pending.clear()
+            try:
+                session, frame = self.pending_frames.pop()
+            except IndexError:
+                continue
+            self.last_inference_time = time.monotonic()
+            self.run_inference(frame, session)
+
+    @staticmethod
+    def _dhash(image):
+        """64-bit difference hash of a BGRA image: one bit per horizontal gradient on a 9x8 grid"""
+        gray = cv2.resize(cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY), (9, 8),
+                          interpolation=cv2.INTER_AREA)
+        bits = (gray[:, 1:] > gray[:, :-1]).ravel()
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+    def run_inference(self, frame, session):
         try:
-            # Convert to RGB and resize for model
-            img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            img = cv2.resize(img, (TARGET_SIZE, TARGET_SIZE))
-            
-            # Convert to float32 numpy array
-            img_array = np.array(img).astype(np.float32)
-            
-            # Add batch dimension
-            img_batch = np.expand_dims(img_array, axis=0)
-            
-            # Run inference
-            start_time = time.time()
-            results = self.model.run(None, {self.input_name: img_batch})[0]
-            inference_time = time.time() - start_time
+            # The preprocessing and input buffers are shared, so only one
+            # inference may use them at a time
+            with self.inference_lock:
+                # Downscale first so the colour conversion only touches 224x224 pixels
+                cv2.resize(frame, (TARGET_SIZE, TARGET_SIZE), dst=self.resize_buffer,
+                           interpolation=cv2.INTER_AREA)
+                
+                # Near-duplicate inputs (scene change triggered by a few pixels)
+                # get the same answer, so reuse the last prediction
+                start_time = time.time()
+                input_hash = self._dhash(self.resize_buffer)
+                if (self.last_input_hash is not None and
+                        bin(input_hash ^ self.last_input_hash).count("1") < DUPLICATE_HASH_DISTANCE):
+                    pred_value = self.last_pred_value
+                    inference_time = time.time() - start_time
+                else:
+                    # Drop alpha, reverse BGR->RGB and cast to the model's float type
+                    # in a single pass straight into the bound input buffer
+                    self.input_buffer[0] = self.resize_buffer[..., 2::-1]
+                    
+                    # Run inference
+                    results = self._run_model()
+                    inference_time = time.time() - start_time
+                    
+                    # Get prediction and confidence
+                    pred_value = float(results[0][0])
+                    self.last_input_hash = input_hash
+                    self.last_pred_value = pred_value
             
-            # Get prediction and confidence
-            pred_value = float(results[0][0])
             is_basketball = pred_value > 0.5
             
             print(f"Inference result: {'Basketball' if is_basketball else 'Not Basketball'} ({pred_value:.4f})")
@@ -613,7 +806,8 @@ class BasketballClassifierApp(QMainWindow):
                 self, "update_prediction", Qt.QueuedConnection,
                 QtCore.Q_ARG(bool, is_basketball),
                 QtCore.Q_ARG(float, pred_value),
-                QtCore.Q_ARG(float, inference_time)
+                QtCore.Q_ARG(float, inference_time),
+                QtCore.Q_ARG(int, session)
             )
             
         except Exception as e:
@@ -621,17 +815,18 @@ class BasketballClassifierApp(QMainWindow):
             print(f"Error in inference: {e}")
             print(traceback.format_exc())
 
-    @QtCore.pyqtSlot(bool, float, float)
-    def update_prediction(self, is_basketball, confidence, inference_time):
+    @QtCore.pyqtSlot(bool, float, float, int)
+    def update_prediction(self, is_basketball, confidence, inference_time, session):
+        # Drop results for frames captured before the last start/stop
+        if not self.running or session != self.capture_session:
+            return
+        
         # Update prediction labels for current frame
         prediction_text = "Basketball" if is_basketball else "Not Basketball"
         self.prediction_label.setText(f"Current Frame: {prediction_text}")
         
         # Set color based on prediction
-        if is_basketball:
-            self.prediction_label.setStyleSheet(f"color: {RED_COLOR}; font-size: 10pt;")
-        else:
-            self.prediction_label.setStyleSheet(f"color: {LIGHT_TEXT_COLOR}; font-size: 10pt;")
+        set_style(self.prediction_label, PREDICTION_STYLE_BB if is_basketball else PREDICTION_STYLE_NB)
         
         # Update confidence
         confidence_pct = confidence * 100 if is_basketball else (1 - confidence) * 100
@@ -640,12 +835,8 @@ class BasketballClassifierApp(QMainWindow):
         # Update model status with inference time
         self.model_status_label.setText(f"Model Status: Inference in {inference_time*1000:.1f}ms")
         
-        # Add to prediction history
-        self.prediction_history.insert(0, (is_basketball, confidence))
-        
-        # Trim history to max size
-        if len(self.prediction_history) > HISTORY_SIZE:
-            self.prediction_history = self.prediction_history[:HISTORY_SIZE]
+        # Add to prediction history (the deque drops the oldest entry)
+        self.prediction_history.appendleft((is_basketball, confidence))
         
         # Calculate consensus from history
         prev_consensus = self.consensus_prediction
@@ -668,16 +859,12 @@ class BasketballClassifierApp(QMainWindow):
             
             # High confidence consensus gets stronger styling
             if self.consensus_confidence >= MIN_CONSENSUS_CONFIDENCE:
-                if self.consensus_prediction:
-                    self.consensus_label.setStyleSheet(f"color: {RED_COLOR}; font-size: 11pt; font-weight: bold;")
-                else:
-                    self.consensus_label.setStyleSheet(f"color: {LIGHT_TEXT_COLOR}; font-size: 11pt; font-weight: bold;")
+                set_style(self.consensus_label, CONSENSUS_STYLE_BB_STRONG if self.consensus_prediction
+                          else CONSENSUS_STYLE_NB_STRONG)
             else:
                 # Lower confidence gets less prominent styling
-                if self.consensus_prediction:
-                    self.consensus_label.setStyleSheet(f"color: {RED_COLOR}; font-size: 11pt; font-style: italic;")
-                else:
-                    self.consensus_label.setStyleSheet(f"color: {LIGHT_TEXT_COLOR}; font-size: 11pt; font-style: italic;")
+                set_style(self.consensus_label, CONSENSUS_STYLE_BB_WEAK if self.consensus_prediction
+                          else CONSENSUS_STYLE_NB_WEAK)
         
         # Update history display
         for i, label in enumerate(self.history_labels):
@@ -688,13 +875,10 @@ class BasketballClassifierApp(QMainWindow):
                 label.setText(f"{i+1}: {hist_text} ({hist_confidence_pct:.1f}%)")
                 
                 # Set color based on prediction
-                if hist_is_basketball:
-                    label.setStyleSheet(f"color: {RED_COLOR};")
-                else:
-                    label.setStyleSheet(f"color: {LIGHT_TEXT_COLOR};")
+                set_prediction_state(label, "basketball" if hist_is_basketball else "")
             else:
                 label.setText(f"{i+1}: N/A")
-                label.setStyleSheet("")
+                set_prediction_state(label, "")
         
         # Update volume control if consensus changed or confidence changed significantly
         if self.volume_control_enabled and self.consensus_prediction is not None:
@@ -709,12 +893,16 @@ class BasketballClassifierApp(QMainWindow):
         if self.overlay_mode:
             # Use consensus prediction for overlay instead of single frame
             if self.consensus_prediction is not None:
-                self.overlay.update_prediction(
-                    self.consensus_prediction, 
-                    self.consensus_confidence / 100.0  # Convert back to 0-1 scale
-                )
+                overlay_prediction = (self.consensus_prediction,
+                                      self.consensus_confidence / 100.0)  # Convert back to 0-1 scale
             else:
-                self.overlay.update_prediction(is_basketball, confidence)
+                overlay_prediction = (is_basketball, confidence)
+            
+            # Smoothed consensus often doesn't move; skip the overlay restyle and repaint
+            overlay_key = (overlay_prediction[0], round(overlay_prediction[1], 3))
+            if overlay_key != self.last_overlay_prediction:
+                self.last_overlay_prediction = overlay_key
+                self.overlay.update_prediction(*overlay_prediction)
 
     def toggle_overlay_mode(self):
         """Toggle between main window and overlay mode"""
@@ -723,6 +911,13 @@ class BasketballClassifierApp(QMainWindow):
             self.overlay_mode = True
             self.overlay_button.setText("Exit Overlay")
             
+            if self.overlay is None:
+                # Most sessions never use the overlay, so only import and build it on demand
+                from overlay import ClassifierOverlay
+                self.overlay = ClassifierOverlay()
+                self.overlay.exitOverlay.connect(self.exit_overlay_mode)
+                self.overlay.toggle_button.clicked.connect(self.overlay_toggle_capture)
+            
             # Make sure overlay shows the correct initial button state
             if not self.running:
                 self.overlay.toggle_button.setText("▶")
@@ -730,6 +925,7 @@ class BasketballClassifierApp(QMainWindow):
                 self.overlay.toggle_button.setText("‖")
             
             self.overlay.running = self.running  # Sync running state
+            self.last_overlay_prediction = None  # Push the next prediction even if unchanged
             
             self.hide()  # Hide main window
             self.overlay.show()  # Show overlay
@@ -766,6 +962,11 @@ class BasketballClassifierApp(QMainWindow):
         """Handle application close event"""
         # Restore volume to original level
         self.volume_controller.restore_volume()
+        
+        # Stop the capture timer on its own thread, then shut the thread down
+        QtCore.QMetaObject.invokeMethod(self.capture_worker, "stop", Qt.BlockingQueuedConnection)
+        self.capture_thread.quit()
+        self.capture_thread.wait()
         super().closeEvent(event)
 
 
@@ -0,0 +1,89 @@
+"""
+Screen Capture Worker for Basketball Classifier App
+This file grabs the screen on a background thread so the Qt main thread
+only has to handle display and scene detection.
+"""
+
+import numpy as np
+import mss
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+# DXGI Desktop Duplication (Windows only, optional). It returns None when the
+# screen hasn't changed, so a static desktop costs no copy at all
+try:
+    import dxcam
+except ImportError:
+    dxcam = None
+
+# mss monitor index to capture: 1 is the primary monitor, 2+ the others.
+# Index 0 is the whole virtual desktop - avoid it, every extra monitor adds
+# pixels to copy, resize and diff on each frame.
+CAPTURE_MONITOR = 1
+
+# "auto" uses dxcam when it is installed and falls back to mss, "mss" forces mss
+CAPTURE_BACKEND = "auto"
+
+class CaptureWorker(QObject):
+    """Grabs a single monitor on a timer and emits each frame as a BGRA array"""
+    frameReady = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        # mss keeps per-thread GDI handles, so it is created on first grab
+        # inside the capture thread rather than here
+        self.sct = None
+        self.monitor = None
+        self.camera = None
+        self.last_frame = None  # re-sent on start when dxcam reports no change
+        if dxcam is not None and CAPTURE_BACKEND == "auto":
+            try:
+                # dxcam numbers outputs from 0, mss reserves 0 for the virtual desktop
+                self.camera = dxcam.create(output_idx=CAPTURE_MONITOR - 1, output_color="BGRA")
+            except Exception as e:
+                print(f"DXGI capture unavailable, using mss: {e}")
+
+        # Parented to the worker so it follows it to the capture thread
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.grab)
+
+    @pyqtSlot(int)
+    def start(self, interval):
+        """Grab a frame immediately, then keep grabbing every interval ms"""
+        self.grab(resend=True)
+        self.timer.start(interval)
+
+    @pyqtSlot()
+    def stop(self):
+        """Stop the periodic capture"""
+        self.timer.stop()
+
+    @pyqtSlot()
+    def grab(self, resend=False):
+        """Capture the configured monitor and emit it"""
+        try:
+            if self.camera is not None:
+                frame = self.camera.grab()
+                if frame is not None:
+                    self.last_frame = frame
+                elif resend:
+                    frame = self.last_frame
+                # None means nothing changed since the last grab
+                if frame is not None:
+                    self.frameReady.emit(frame)
+                return
+
+            if self.sct is None:
+                self.sct = mss.mss()
+                # Fall back to the primary monitor if the configured one is gone
+                index = CAPTURE_MONITOR if CAPTURE_MONITOR < len(self.sct.monitors) else 1
+                self.monitor = self.sct.monitors[index]
+
+            shot = self.sct.grab(self.monitor)
+
+            # View the raw BGRA bytes without copying; consumers work in BGRA
+            frame = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+            self.frameReady.emit(frame)
+        except Exception as e:
+            import traceback
+            print(f"Error capturing screen: {e}")
+            print(traceback.format_exc())
@@ -1,158 +1,206 @@
 """
 Fluid Animation for Basketball Classifier App
 This file creates elegant, flowing red lines similar to the reference image.
-Revised version using QGraphicsScene and QGraphicsBlurEffect for soft glow.
-Includes fix for removing the default QGraphicsView border.
+Each curve's soft glow is blurred once into a cached pixmap, which a plain
+QWidget then draws with per-curve opacity.
 """
 
 import math
 import random
-import time
-from PyQt5.QtCore import Qt, QTimer, QPointF, QPropertyAnimation, QEasingCurve, QRectF
-from PyQt5.QtGui import QPainter, QColor, QPainterPath, QPen
-from PyQt5.QtWidgets import (QWidget, QGraphicsOpacityEffect, QGraphicsView,
-                             QGraphicsScene, QGraphicsPathItem, QGraphicsBlurEffect,
-                             QGraphicsItem, QFrame) # <-- Import QFrame
+import struct
+from PyQt5.QtCore import (Qt, QTimer, QPointF, QPropertyAnimation, QEasingCurve, QRectF,
+                          QByteArray, QDataStream, QIODevice, pyqtProperty)
+from PyQt5.QtGui import QPainter, QColor, QPainterPath, QPainterPathStroker, QPen, QImage, QPixmap
+from PyQt5.QtWidgets import QWidget, QGraphicsScene, QGraphicsBlurEffect
 
 # Define colors directly
 RED_COLOR = QColor(255, 50, 50) # Adjusted red
 DARK_BG_COLOR = QColor(0, 0, 0) # Black background
-
-# --- Custom Graphics Item for the Curve ---
-class CurveItem(QGraphicsPathItem):
-    """A QGraphicsPathItem representing a single flowing, blurred curve."""
-    def __init__(self, full_path, width, height):
-        super().__init__(full_path)
-        self.full_path = full_path # Store the complete path
-        self.width = width
-        self.height = height
+FRAME_INTERVAL = 33 # ms, ~30fps is smooth enough for slow, blurred curves
+FRAME_SCALE = FRAME_INTERVAL / 16 # Per-frame speeds below were tuned at 16 ms frames
+CURVE_SAMPLE_STEP = 0.015 # Fraction of the curve between samples; balances smoothness and performance
+CURVE_SHAPE_CACHE_SIZE = 32 # Distinct curves generated per view size before they start being reused
+MIN_VISIBLE_OPACITY = 1 / 255 # Below one 8-bit alpha step nothing drawn shows up
+
+# QDataStream layout of a QPainterPath (big-endian): element count, then
+# (type, x, y) per element, then the current subpath start and the fill rule
+PATH_COUNT = struct.Struct(">i")
+PATH_ELEMENT = struct.Struct(">idd")
+PATH_FOOTER = struct.Struct(">ii")
+
+def render_blurred_stroke(path, pen, blur_radius):
+    """Stroke and blur a path once, returning the pixmap and its top-left position in widget coordinates."""
+    margin = blur_radius * 2 + pen.widthF()
+    rect = path.boundingRect().adjusted(-margin, -margin, margin, margin).toAlignedRect()
+    image = QImage(rect.size(), QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+
+    # Same blur the curves used to get on every repaint, run once through a throwaway scene
+    scene = QGraphicsScene()
+    item = scene.addPath(path, pen)
+    blur_effect = QGraphicsBlurEffect()
+    blur_effect.setBlurRadius(blur_radius)
+    item.setGraphicsEffect(blur_effect)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    scene.render(painter, QRectF(image.rect()), QRectF(rect))
+    painter.end()
+    return QPixmap.fromImage(image), QPointF(rect.topLeft())
+
+# --- Reusable Curve Geometry ---
+class CurveShape:
+    """The expensive, reusable part of a curve: its path, samples and blurred stroke."""
+    def __init__(self, full_path):
+        self.full_path = full_path
 
         # --- Visual Properties ---
         self.base_color = RED_COLOR
         self.base_thickness = random.uniform(1.5, 2.5) # Increased thickness
         self.blur_radius = random.uniform(10, 18)    # Increased blur radius
 
+        # --- Pen ---
+        pen = QPen(self.base_color)
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+        pen.setWidthF(self.base_thickness)
+
+        # --- Blurred stroke, rendered once instead of blurring every frame ---
+        self.pixmap, self.offset = render_blurred_stroke(full_path, pen, self.blur_radius)
+
+        # While growing, only the part of the pixmap around the grown section
+        # of the curve (including its glow) is drawn
+        self.reveal_stroker = QPainterPathStroker()
+        self.reveal_stroker.setWidth(2 * (self.blur_radius * 2 + self.base_thickness))
+        self.reveal_stroker.setCapStyle(Qt.RoundCap)
+        self.reveal_stroker.setJoinStyle(Qt.RoundJoin)
+
+        # Sample the curve once; growing only ever reveals a prefix of these points.
+        # They are kept pre-serialized as QPainterPath stream elements (MoveTo
+        # then LineTos) so a prefix can be loaded into a path in a single call
+        sample_count = int(1.0 / CURVE_SAMPLE_STEP)
+        samples = [full_path.pointAtPercent(i * CURVE_SAMPLE_STEP) for i in range(sample_count + 1)]
+        self.sample_bytes = PATH_ELEMENT.pack(QPainterPath.MoveToElement, samples[0].x(), samples[0].y())
+        self.sample_bytes += b"".join(PATH_ELEMENT.pack(QPainterPath.LineToElement, pt.x(), pt.y())
+                                      for pt in samples[1:])
+
+# --- A Single Animated Curve ---
+class CurveItem:
+    """A pre-blurred flowing curve, revealed along its length while it grows."""
+    def __init__(self, shape, width, height):
+        self.shape_data = shape
+        self.full_path = shape.full_path # Store the complete path
+        self.width = width
+        self.height = height
+
         # --- Animation Properties ---
         self.life = 1.0
-        self.fade_speed = random.uniform(0.0015, 0.004)
+        self.fade_speed = random.uniform(0.0015, 0.004) * FRAME_SCALE
         self.animation_offset = random.uniform(0, 2 * math.pi)
 
         # --- Growth Animation ---
         self.progress = 0.0
         self.growth_complete = False
-        self.growth_speed = random.uniform(0.01, 0.025)
-
-        # --- Graphics Effects ---
-        self.setOpacity(0.0) # Start fully transparent
-        self.blur_effect = QGraphicsBlurEffect()
-        self.blur_effect.setBlurRadius(self.blur_radius)
-        self.setGraphicsEffect(self.blur_effect)
-
-        # --- Pen ---
-        self.current_pen = QPen(self.base_color)
-        self.current_pen.setCapStyle(Qt.RoundCap)
-        self.current_pen.setJoinStyle(Qt.RoundJoin)
-        self.current_pen.setWidthF(self.base_thickness)
-        self.setPen(self.current_pen)
+        self.growth_speed = random.uniform(0.01, 0.025) * FRAME_SCALE
 
-        # Initial path setup (start empty)
-        self.setPath(QPainterPath())
+        self.opacity = 0.0 # Start fully transparent
+        self.reveal_path = QPainterPath()
 
     def update_item(self):
-        """Update the curve's state (growth, life, opacity, path). Returns True if alive."""
+        """Update the curve's state (growth, life, opacity, revealed area). Returns True if alive."""
         if not self.growth_complete:
             # Grow the curve gradually
             self.progress += self.growth_speed
             if self.progress >= 1.0:
                 self.progress = 1.0
                 self.growth_complete = True
-                self.setOpacity(1.0) # Set full opacity once grown
-            else:
-                 self.setOpacity(self.progress) # Fade in as it grows
-
-            # Update the drawn path based on progress
-            new_path = QPainterPath()
-            start_point = self.full_path.pointAtPercent(0)
-            # Check if the path is valid and progress > 0 before drawing
-            if self.progress > 0 and start_point is not None:
-                 new_path.moveTo(start_point)
-                 step = 0.015 # Balance smoothness and performance
-                 current_percent = step
-                 while current_percent < self.progress:
-                      pt = self.full_path.pointAtPercent(current_percent)
-                      # Check if pointAtPercent returned a valid point
-                      if pt is not None:
-                           new_path.lineTo(pt)
-                      current_percent += step
-                 # Add the final point precisely at the progress percentage
-                 final_pt = self.full_path.pointAtPercent(self.progress)
-                 if final_pt is not None:
-                      new_path.lineTo(final_pt)
-                 self.setPath(new_path)
+                self.opacity = 1.0 # Set full opacity once grown
             else:
-                 # Set an empty path if progress is 0 or path is invalid
-                 self.setPath(QPainterPath())
+                 self.opacity = self.progress # Fade in as it grows
+
+            # Update the revealed area based on progress
+            self.reveal_path = self.shape_data.reveal_stroker.createStroke(self._grown_path())
 
         else:
             # Fade out
             self.life -= self.fade_speed
-            self.setOpacity(max(0.0, self.life)) # Fade item's opacity
-
-        # Optional: Update pen thickness pulsing
-        # thickness_variation = math.sin(time.time() * 1.8 + self.animation_offset) * 0.2 + 1.0
-        # self.current_pen.setWidthF(self.base_thickness * thickness_variation)
-        # self.setPen(self.current_pen) # Uncomment if pulsing is desired
+            self.opacity = max(0.0, self.life) # Fade item's opacity
 
         # Check if item should be removed
         return self.life > -0.1
 
-# --- Main Animation Widget (now QGraphicsView) ---
-class FluidAnimation(QGraphicsView):
-    """Fluid animation widget using QGraphicsScene for blurred curves."""
+    def _grown_path(self):
+        """Build the grown part of the curve from the serialized samples."""
+        # Precomputed samples strictly before the current progress, plus the
+        # final point precisely at the progress percentage
+        count = math.ceil(self.progress / CURVE_SAMPLE_STEP)
+        final_pt = self.full_path.pointAtPercent(self.progress)
+        data = (PATH_COUNT.pack(count + 1) +
+                self.shape_data.sample_bytes[:count * PATH_ELEMENT.size] +
+                PATH_ELEMENT.pack(QPainterPath.LineToElement, final_pt.x(), final_pt.y()) +
+                PATH_FOOTER.pack(0, Qt.OddEvenFill))
+
+        # The byte array must outlive the stream reading from it
+        buffer = QByteArray(data)
+        path = QPainterPath()
+        QDataStream(buffer, QIODevice.ReadOnly) >> path
+        return path
+
+    def draw(self, painter, fade):
+        """Draw the cached blurred stroke, clipped to the grown section while growing."""
+        if self.opacity * fade < MIN_VISIBLE_OPACITY:
+            return
+        painter.setOpacity(self.opacity * fade)
+        if not self.growth_complete:
+            painter.setClipPath(self.reveal_path)
+        painter.drawPixmap(self.shape_data.offset, self.shape_data.pixmap)
+        painter.setClipping(False)
+
+# --- Main Animation Widget ---
+class FluidAnimation(QWidget):
+    """Fluid animation widget drawing cached, pre-blurred curves on a black background."""
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # --- Scene Setup ---
-        self.scene = QGraphicsScene(self)
-        self.setScene(self.scene)
-        # Initial scene rect, will be updated in resizeEvent
-        self.setSceneRect(0, 0, self.width(), self.height())
-
-        # --- View Setup ---
-        self.setFrameShape(QFrame.NoFrame) # <--- REMOVE DEFAULT BORDER
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setRenderHint(QPainter.Antialiasing)
-        self.setRenderHint(QPainter.SmoothPixmapTransform)
-        self.setBackgroundBrush(DARK_BG_COLOR)
-        self.setCacheMode(QGraphicsView.CacheBackground)
-        self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
+        # --- Widget Setup ---
+        # Every paint fills the whole widget, so Qt needn't clear it first
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
 
         # --- Animation Control ---
         self.curves = [] # Holds CurveItem instances
+        self.curve_shapes = [] # Cached CurveShapes for the current size, reused round after round
         self.max_curves = 12 # Slightly increased density
         self.animation_timer = QTimer(self)
         self.animation_timer.timeout.connect(self.update_animation)
-        self.last_curve_time = 0
+        self.tick = 0 # Frames since creation; paces curve generation without reading the clock
+        self.last_curve_tick = 0
         self.curve_interval = 750 # ms, slightly faster generation
 
-        # --- Fade In/Out (Using Opacity Effect on the Viewport) ---
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        # Apply effect to viewport() for content fade without affecting potential parent widget borders
-        self.viewport().setGraphicsEffect(self.opacity_effect)
-        self.opacity_effect.setOpacity(0)
-
-        self.fade_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        # --- Fade In/Out ---
+        # Applied as painter opacity on the curves rather than through a
+        # QGraphicsOpacityEffect, which would render the widget offscreen first
+        self.fade_level = 0.0
+        self.fade_animation = QPropertyAnimation(self, b"fade")
         self.fade_animation.setDuration(800)
         self.fade_animation.setEasingCurve(QEasingCurve.InOutQuad)
+        # Connected once; _complete_stop ignores fade-ins
+        self.fade_animation.finished.connect(self._complete_stop)
 
         self.animation_active = False
 
+    def get_fade(self):
+        return self.fade_level
+
+    def set_fade(self, value):
+        self.fade_level = value
+        self.update()
+
+    fade = pyqtProperty(float, get_fade, set_fade)
+
     def _create_curve_path(self):
         """Generates the QPainterPath for a new curve."""
         path = QPainterPath()
-        # Use sceneRect dimensions which are updated on resize
-        w, h = self.sceneRect().width(), self.sceneRect().height()
+        w, h = self.width(), self.height()
         if w <= 0 or h <= 0: # Avoid division by zero if view not yet sized
              return path
 
@@ -212,21 +260,36 @@ class FluidAnimation(QGraphicsView):
         return path
 
 
+    def _next_curve_shape(self):
+        """Build a new curve shape until the cache is full, then reuse one that isn't on screen."""
+        if len(self.curve_shapes) < CURVE_SHAPE_CACHE_SIZE:
+            new_full_path = self._create_curve_path()
+            if new_full_path.isEmpty():
+                return None
+            shape = CurveShape(new_full_path)
+            self.curve_shapes.append(shape)
+            return shape
+
+        # Showing the same shape twice at once would just double it up
+        in_use = {curve.shape_data for curve in self.curves}
+        return random.choice([shape for shape in self.curve_shapes if shape not in in_use])
+
     def start_animation(self):
         """Start the fluid animation with fade-in effect."""
         if self.animation_active:
             return
         self.animation_active = True
-        self.animation_timer.start(16) # Target ~60fps
+        # While hidden (e.g. overlay mode) showEvent starts the timer later
+        if self.isVisible():
+            self.animation_timer.start(FRAME_INTERVAL)
 
-        # Clear scene and list immediately before starting
-        self.scene.clear() # Removes all items from the scene
-        self.curves.clear() # Clears the Python list holding references
-        self.last_curve_time = time.time() * 1000 # Reset generation timer
+        # Clear curves immediately before starting
+        self.curves.clear()
+        self.last_curve_tick = self.tick # Reset generation timer
 
-        # Fade in the viewport
+        # Fade in
         self.fade_animation.stop()
-        self.fade_animation.setStartValue(self.opacity_effect.opacity())
+        self.fade_animation.setStartValue(self.fade_level)
         self.fade_animation.setEndValue(1.0)
         self.fade_animation.start()
 
@@ -237,73 +300,67 @@ class FluidAnimation(QGraphicsView):
 
         self.animation_active = False # Prevent new curves
 
-        # Fade out the viewport
+        # Fade out
         self.fade_animation.stop()
-        self.fade_animation.setStartValue(self.opacity_effect.opacity())
+        self.fade_animation.setStartValue(self.fade_level)
         self.fade_animation.setEndValue(0.0)
         self.fade_animation.start()
 
-        # Connect safely to _complete_stop
-        connection = lambda: self._complete_stop(connection)
-        try:
-             self.fade_animation.finished.disconnect()
-        except TypeError:
-             pass
-        self.fade_animation.finished.connect(connection)
-
-    def _complete_stop(self, connection_lambda):
+    def _complete_stop(self):
         """Complete the animation stop after fade-out completes."""
         if self.fade_animation.endValue() == 0: # Only if fading out
             self.animation_timer.stop()
-            # Ensure scene and list are cleared after fade out finishes
-            self.scene.clear()
+            # Ensure curves are cleared after fade out finishes
             self.curves.clear()
             # print("Animation Stopped and Cleared")
 
-        try:
-            self.fade_animation.finished.disconnect(connection_lambda)
-        except TypeError:
-            pass
-
     def update_animation(self):
         """Update the animation state: add curves, update items."""
-        current_time = time.time() * 1000
+        # The tail of a fade-out is invisible; nothing left to animate
+        if not self.animation_active and self.fade_level < MIN_VISIBLE_OPACITY:
+            return
+
+        self.tick += 1
 
         # Add new curves periodically
         if self.animation_active and len(self.curves) < self.max_curves and \
-           current_time - self.last_curve_time > self.curve_interval:
-            new_full_path = self._create_curve_path()
+           (self.tick - self.last_curve_tick) * FRAME_INTERVAL > self.curve_interval:
+            shape = self._next_curve_shape()
             # Only add if path is valid (has elements)
-            if not new_full_path.isEmpty():
-                curve_item = CurveItem(new_full_path, self.sceneRect().width(), self.sceneRect().height())
-                self.scene.addItem(curve_item)
+            if shape is not None:
+                curve_item = CurveItem(shape, self.width(), self.height())
                 self.curves.append(curve_item)
-                self.last_curve_time = current_time
-
-        # Update existing curves and remove dead ones
-        alive_curves = []
-        items_to_remove = []
-        for curve in self.curves:
-            if curve.update_item():
-                alive_curves.append(curve)
-            else:
-                items_to_remove.append(curve)
-
-        # Remove dead items from the scene *after* iterating
-        for item in items_to_remove:
-             # Check if item is still in the scene before removing (safety check)
-             if item.scene() == self.scene:
-                  self.scene.removeItem(item)
-
-        self.curves = alive_curves
-        # Scene handles repainting efficiently based on item changes
-
+                self.last_curve_tick = self.tick
+
+        # Update existing curves and drop dead ones
+        self.curves = [curve for curve in self.curves if curve.update_item()]
+        self.update()
+
+
+    def paintEvent(self, event):
+        """Draw the background and every curve's cached pixmap."""
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), DARK_BG_COLOR)
+        # Skip the curves while the fade makes them invisible
+        if self.fade_level >= MIN_VISIBLE_OPACITY:
+            painter.setRenderHint(QPainter.Antialiasing)
+            for curve in self.curves:
+                curve.draw(painter, self.fade_level)
+        painter.end()
+
+    def hideEvent(self, event):
+        """Pause the animation while hidden (capture running, overlay mode, minimized)."""
+        super().hideEvent(event)
+        self.animation_timer.stop()
+
+    def showEvent(self, event):
+        """Resume the animation if it was running when the widget was hidden."""
+        super().showEvent(event)
+        if self.animation_active or self.fade_animation.state() == QPropertyAnimation.Running:
+            self.animation_timer.start(FRAME_INTERVAL)
 
     def resizeEvent(self, event):
-        """Handle view resize: update scene rect and fit view."""
+        """Handle resize: curves are laid out for the widget's current size."""
         super().resizeEvent(event)
-        # Update the scene rectangle to match the new view size
-        new_rect = QRectF(0, 0, event.size().width(), event.size().height())
-        self.setSceneRect(new_rect)
-        # Fit the scene content within the view without scrollbars
-        self.fitInView(new_rect, Qt.IgnoreAspectRatio) # Stretch to fill
\ No newline at end of file
+        # Cached shapes were laid out for the old size
+        self.curve_shapes.clear()
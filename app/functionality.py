@@ -3,14 +3,42 @@ Basketball Classifier - Audio Control Functionality
 Handles system volume control with smooth transitions based on basketball detection
 """
 import time
-import threading
-import numpy as np
-from ctypes import cast, POINTER
-from comtypes import CLSCTX_ALL
+import logging
+from ctypes import cast, byref, POINTER
+from comtypes import CLSCTX_ALL, COMObject, GUID
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+from pycaw.api.endpointvolume import IAudioEndpointVolumeCallback
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# Fade and user-volume tracking messages are debug level; errors still reach stderr
+logger = logging.getLogger(__name__)
+
+# Smallest volume change worth a SetMasterVolumeLevelScalar call
+VOLUME_EPSILON = 1 / 512
+
+# Passed with our own volume writes so their change notifications can be told
+# apart from the user moving the volume
+VOLUME_EVENT_CONTEXT = GUID.create_new()
+
+class VolumeChangeCallback(COMObject):
+    """Receives endpoint volume notifications on a COM worker thread"""
+    _com_interfaces_ = [IAudioEndpointVolumeCallback]
+
+    def __init__(self, signal):
+        super().__init__()
+        self.signal = signal
+
+    def OnNotify(self, pNotify):
+        data = pNotify.contents
+        if data.guidEventContext != VOLUME_EVENT_CONTEXT:
+            # Queued over to the controller's thread, nothing is touched here
+            self.signal.emit(data.fMasterVolume)
+
+class VolumeController(QObject):
+    userVolumeChanged = pyqtSignal(float)
 
-class VolumeController:
     def __init__(self):
+        super().__init__()
         # Initialize the volume controller
         self.devices = AudioUtilities.GetSpeakers()
         self.interface = self.devices.Activate(
@@ -28,18 +56,30 @@ class VolumeController:
         # Configuration
         self.volume_reduction_factor = 0.2  # Reduce to 20% when not basketball (80% reduction)
         self.fade_duration = 1.0  # Seconds for fade transition
-        self.fade_steps = 20  # Number of steps in a fade transition
-        self.volume_check_interval = 0.5  # Check for user volume changes more frequently
+        self.fade_steps = 10  # Number of steps in a fade transition (evenly spaced in loudness)
         
         # State tracking
         self.is_basketball = True
         self.is_transitioning = False
-        self.fade_thread = None
-        self.volume_monitor_thread = None
+        
+        # Fades are stepped by a timer on the GUI thread; starting a new fade
+        # simply retargets it instead of racing a second thread
+        self.fade_timer = QTimer()
+        self.fade_timer.timeout.connect(self.fade_step)
+        self.fade_start_volume = self.original_volume
+        self.fade_end_volume = self.original_volume
+        self.fade_start_time = 0.0
+        self.fade_length = self.fade_duration
         self.running = True
         
-        # Start volume monitoring thread
-        self.start_volume_monitoring()
+        # Windows pushes volume changes to us instead of us polling for them
+        self.userVolumeChanged.connect(self.on_user_volume_change)
+        self.volume_callback = VolumeChangeCallback(self.userVolumeChanged)
+        try:
+            self.volume.RegisterControlChangeNotify(self.volume_callback)
+        except Exception as e:
+            logger.error("Error registering volume notifications: %s", e)
+            self.volume_callback = None
     
     def get_volume(self):
         """Get current system volume (0.0 to 1.0)"""
@@ -47,157 +87,125 @@ class VolumeController:
             # Scalar volume is from 0.0 to 1.0
             return self.volume.GetMasterVolumeLevelScalar()
         except Exception as e:
-            print(f"Error getting volume: {e}")
+            logger.error("Error getting volume: %s", e)
             return 1.0
     
-    def set_volume(self, level):
+    def set_volume(self, level, force=False):
         """Set system volume (0.0 to 1.0)"""
         try:
             # Ensure level is within valid range
             level = max(0.0, min(1.0, level))
-            self.volume.SetMasterVolumeLevelScalar(level, None)
+            # Adjacent fade steps often land on the same level; skip the COM call
+            if not force and abs(level - self.current_volume) < VOLUME_EPSILON:
+                return True
+            self.volume.SetMasterVolumeLevelScalar(level, byref(VOLUME_EVENT_CONTEXT))
             self.current_volume = level
             return True
         except Exception as e:
-            print(f"Error setting volume: {e}")
+            logger.error("Error setting volume: %s", e)
             return False
     
-    def start_volume_monitoring(self):
-        """Start a thread to monitor volume changes made by the user"""
-        self.volume_monitor_thread = threading.Thread(target=self.monitor_volume)
-        self.volume_monitor_thread.daemon = True
-        self.volume_monitor_thread.start()
-    
-    def monitor_volume(self):
-        """Monitor volume changes during basketball content to adapt to user preferences"""
-        last_checked_volume = self.current_volume
-        
-        while self.running:
-            # Only track volume changes when in basketball mode and not during transitions
-            if self.is_basketball and not self.is_transitioning:
-                current_vol = self.get_volume()
-                
-                # If volume changed significantly and not by our own code
-                if abs(current_vol - last_checked_volume) > 0.01:  # More sensitive to changes
-                    # User changed the volume - update preferred basketball volume
-                    print(f"User adjusted volume to: {current_vol:.2f}")
-                    self.user_basketball_volume = current_vol
-                    self.current_volume = current_vol
-                
-                # Even if we didn't detect a significant change, always update 
-                # the user's preferred level to the current system volume
-                # This ensures we capture any small incremental changes too
-                self.user_basketball_volume = current_vol
-                
-                last_checked_volume = current_vol
-            
-            # Check periodically
-            time.sleep(self.volume_check_interval)
+    def on_user_volume_change(self, level):
+        """Track volume changes made outside the app to adapt to user preferences"""
+        self.current_volume = level
+        
+        # Only track the preference in basketball mode and not during transitions
+        if self.is_basketball and not self.is_transitioning:
+            if abs(level - self.user_basketball_volume) > 0.01:
+                logger.debug("User adjusted volume to: %.2f", level)
+            self.user_basketball_volume = level
     
     def fade_volume(self, start_vol, end_vol, duration, steps):
         """Smoothly fade volume from start to end"""
         self.is_transitioning = True
+        self.fade_start_volume = start_vol
+        self.fade_end_volume = end_vol
+        self.fade_length = duration
+        self.fade_start_time = time.monotonic()
+        
+        # start_vol was just read from the system, so there is nothing to set yet
+        self.current_volume = start_vol
+        self.fade_timer.start(max(1, int(duration * 1000 / steps)))
+    
+    def fade_step(self):
+        """Advance the running fade by one timer tick"""
+        if not self.running:
+            self.fade_timer.stop()
+            self.is_transitioning = False
+            return
         
-        # Calculate volume steps
-        volume_steps = np.linspace(start_vol, end_vol, steps)
-        step_time = duration / steps
-        
-        # Perform the fade
-        for vol in volume_steps:
-            if not self.running:
-                break
-            self.set_volume(vol)
-            time.sleep(step_time)
-        
-        # Ensure we reach final volume
-        if self.running:
-            self.set_volume(end_vol)
-        
-        self.is_transitioning = False
+        progress = (time.monotonic() - self.fade_start_time) / self.fade_length
+        if progress >= 1.0:
+            # Ensure we reach final volume
+            self.fade_timer.stop()
+            self.set_volume(self.fade_end_volume)
+            self.is_transitioning = False
+        elif min(self.fade_start_volume, self.fade_end_volume) < VOLUME_EPSILON:
+            # A geometric curve can't start or end at silence, interpolate linearly
+            self.set_volume(self.fade_start_volume +
+                            (self.fade_end_volume - self.fade_start_volume) * progress)
+        else:
+            # Equal ratios per step sound like equal loudness steps, so the fade
+            # doesn't audibly finish early and fewer steps are needed
+            self.set_volume(self.fade_start_volume *
+                            (self.fade_end_volume / self.fade_start_volume) ** progress)
     
     def update_classification(self, is_basketball, confidence):
         """Update volume based on classification result"""
         # Don't take any action if classification hasn't changed
         if self.is_basketball == is_basketball:
             return
-        
-        # Get current system volume before making changes
-        current_system_volume = self.get_volume()
-        
-        # Print transition information
-        if is_basketball:
-            print(f"======= TRANSITION: NOT BASKETBALL → BASKETBALL =======")
-            print(f"  Current system volume: {current_system_volume:.2f}")
-            print(f"  User's basketball volume: {self.user_basketball_volume:.2f}")
-            print(f"  Confidence level: {confidence:.1f}%")
-        else:
-            print(f"======= TRANSITION: BASKETBALL → NOT BASKETBALL =======")
-            print(f"  Current system volume: {current_system_volume:.2f}")
-            print(f"  Will save as user's basketball volume: {current_system_volume:.2f}")
-            print(f"  Confidence level: {confidence:.1f}%")
-        
-        # Update state
-        prev_state = self.is_basketball
         self.is_basketball = is_basketball
         
-        # Calculate confidence factor (higher confidence = more dramatic changes)
-        confidence_factor = min(1.0, confidence / 100.0)
+        # Read the system volume once; it is both the fade start and the saved preference
+        current_system_volume = self.get_volume()
         
         if is_basketball:
-            # Important: Only use user_basketball_volume if we're coming from a non-basketball state
-            # This prevents jumps to an old volume level when already at the user's current preference
-            if not prev_state:
-                print(f"Basketball detected, restoring to user volume: {self.user_basketball_volume:.2f}")
-                self.target_volume = self.user_basketball_volume
-            else:
-                # We should never get here, but just in case - keep current volume
-                print(f"Basketball already detected, maintaining current volume")
-                self.target_volume = current_system_volume
+            # Coming from a non-basketball state, go back to the user's basketball volume
+            self.target_volume = self.user_basketball_volume
         else:
             # Not basketball - capture current volume as user's preferred basketball volume
             # (only if not already in a reduced state)
             if not self.is_transitioning:
                 self.user_basketball_volume = current_system_volume
-                print(f"Saving user's basketball volume preference: {self.user_basketball_volume:.2f}")
             
             # Reduce volume based on confidence and user's preferred level
-            # Use higher reduction factor (80% reduction = 20% of original)
+            # (higher confidence = more dramatic changes, 80% reduction = 20% of original)
+            confidence_factor = min(1.0, confidence / 100.0)
             reduced_volume = self.user_basketball_volume * self.volume_reduction_factor * confidence_factor
             self.target_volume = max(reduced_volume, self.user_basketball_volume * 0.1)  # Don't go below 10% of user pref
-            print(f"Not basketball, reducing volume to: {self.target_volume:.2f} (80% reduction)")
         
         # Only proceed with fade if target is different from current
         if abs(current_system_volume - self.target_volume) < 0.01:
-            print(f"No volume change needed, already at {current_system_volume:.2f}")
             return
-            
-        # Stop existing fade if in progress
-        if self.fade_thread and self.fade_thread.is_alive():
-            # Let current thread finish naturally by continuing with new target
-            pass
         
-        print(f"Starting volume fade: {current_system_volume:.2f} → {self.target_volume:.2f}")
+        # Arguments are only formatted when debug logging is enabled
+        logger.debug("Transition to %s: volume fade %.2f → %.2f (user's basketball volume %.2f, confidence %.1f%%)",
+                     "BASKETBALL" if is_basketball else "NOT BASKETBALL",
+                     current_system_volume, self.target_volume, self.user_basketball_volume, confidence)
         
         # Start new fade from current system volume (not self.current_volume)
-        # This ensures we're always starting from the actual current system state
-        self.fade_thread = threading.Thread(
-            target=self.fade_volume,
-            args=(current_system_volume, self.target_volume, self.fade_duration, self.fade_steps)
-        )
-        self.fade_thread.daemon = True
-        self.fade_thread.start()
+        # This ensures we're always starting from the actual current system state.
+        # A fade already in progress is taken over by the new one
+        self.fade_volume(current_system_volume, self.target_volume, self.fade_duration, self.fade_steps)
     
     def restore_volume(self):
         """Restore original volume when closing the application"""
         # Set running to false to interrupt any ongoing fades
         self.running = False
         
-        # Wait for any transition to complete
-        if self.fade_thread and self.fade_thread.is_alive():
-            self.fade_thread.join(timeout=0.5)
+        # Stop any transition in progress
+        self.fade_timer.stop()
+        
+        if self.volume_callback is not None:
+            try:
+                self.volume.UnregisterControlChangeNotify(self.volume_callback)
+            except Exception as e:
+                logger.error("Error unregistering volume notifications: %s", e)
+            self.volume_callback = None
         
         # Reset to original volume immediately
-        self.set_volume(self.original_volume)
+        self.set_volume(self.original_volume, force=True)
     
     def set_fade_duration(self, seconds):
         """Configure the fade duration"""
@@ -9,8 +9,9 @@ from RED_COLOR at the outside to DARK_BG_COLOR at the inside of the glow.
 import os
 import sys
 import time
+from functools import lru_cache
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QRect, QPoint, QRectF
-from PyQt5.QtGui import (QFont, QColor, QPainter, QPen, QBrush,
+from PyQt5.QtGui import (QFont, QColor, QPainter, QPen, QBrush, QPixmap, QImage,
                          QRadialGradient, QLinearGradient, QPainterPath)
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel,
                              QVBoxLayout, QHBoxLayout,
@@ -35,15 +36,157 @@ LIGHT_TEXT_QCOLOR = QColor(LIGHT_TEXT_COLOR) if isinstance(LIGHT_TEXT_COLOR, str
 # Adjust alpha (0-255) as needed for desired background transparency
 DARK_BG_QCOLOR.setAlpha(245)  # Increased from 230 to 245 for more opacity
 
+# Corner radius of the overlay's rounded background
+CORNER_RADIUS = 20.0
+
+# Width of the glow band around the solid background
+GLOW_EXTENT = 5  # Reduced from 18 to 10 for thinner gradient
+
+# Minimum time between overlay label refreshes in ms
+OVERLAY_REFRESH_INTERVAL = 200
+
+# Stylesheets are built once here instead of on every overlay or prediction update
+BUTTON_SIZE = 45
+_button_hover_qcolor = RED_QCOLOR.lighter(140)
+_button_hover_qcolor.setHsv(_button_hover_qcolor.hue(), max(0, int(_button_hover_qcolor.saturation() * 0.7)), _button_hover_qcolor.value())
+
+# Both round buttons share one sheet, set once on the overlay; the exit button
+# only differs in glyph size, picked out by its object name
+BUTTON_STYLE = f"""
+    QPushButton {{
+        background-color: #181818;
+        color: {RED_QCOLOR.name()};
+        border-radius: {BUTTON_SIZE / 2}px;
+        border: 2px solid {RED_QCOLOR.name()};
+        font-family: 'Arial';
+        font-size: 16px;
+        font-weight: bold;
+        text-align: center;
+        padding: 0px;
+    }}
+    QPushButton#exitButton {{
+        font-size: 18px;
+    }}
+    QPushButton:hover {{
+        background-color: #282828;
+        border: 2px solid {_button_hover_qcolor.name()};
+        color: {_button_hover_qcolor.name()};
+    }}
+    QPushButton:pressed {{
+        background-color: #383838;
+    }}
+"""
+LABEL_STYLE = f"color: {LIGHT_TEXT_QCOLOR.name()}; background-color: transparent;"
+# One sheet for both classes; flipping the "prediction" property re-polishes the
+# label without handing Qt a new stylesheet to parse
+PREDICTION_LABEL_STYLE = f"""
+    QLabel {{ color: {LIGHT_TEXT_QCOLOR.name()}; font-weight: bold; background-color: transparent; }}
+    QLabel[prediction="basketball"] {{ color: {RED_QCOLOR.name()}; }}
+"""
+
+@lru_cache(maxsize=8)
+def render_background_pixmap(width, height, ratio):
+    """Render the glow and solid background for an overlay size; cached so overlays of that size share it."""
+    # Define base colors
+    bg_color_base = QColor(DARK_BG_QCOLOR) # Use base color for blending
+    red_color_base = QColor(RED_QCOLOR)   # Use base color for blending
+
+    # Rectangles defining the glow region and the solid background region
+    outer_glow_rect = QRectF(0, 0, width, height)
+    solid_bg_rect = outer_glow_rect.adjusted(GLOW_EXTENT, GLOW_EXTENT, -GLOW_EXTENT, -GLOW_EXTENT)
+
+    # Premultiplied ARGB is what the raster engine blits fastest
+    image = QImage(round(width * ratio), round(height * ratio), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(ratio)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+
+    # Ensure the solid background rectangle is valid
+    if solid_bg_rect.width() <= 0 or solid_bg_rect.height() <= 0:
+        print("Warning: Widget size too small for defined glow extent. Drawing solid background.")
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(bg_color_base)) # Use brush for solid fill
+        painter.drawRoundedRect(outer_glow_rect, CORNER_RADIUS, CORNER_RADIUS)
+        painter.end()
+        return QPixmap.fromImage(image)
+
+    painter.setBrush(Qt.NoBrush) # Don't fill the shape
+
+    num_glow_layers = 60 # Increased layers for smoother transition
+
+    # Iterate from the outer edge inwards
+    for i in range(num_glow_layers):
+        # Calculate the blending factor for this layer (0 at outer edge, 1 at inner edge of glow)
+        lerp_factor = i / (num_glow_layers - 1) if num_glow_layers > 1 else 0.0
+
+        # Calculate the current rectangle for this layer
+        current_rect = QRectF(
+            outer_glow_rect.left() * (1.0 - lerp_factor) + solid_bg_rect.left() * lerp_factor,
+            outer_glow_rect.top() * (1.0 - lerp_factor) + solid_bg_rect.top() * lerp_factor,
+            outer_glow_rect.width() * (1.0 - lerp_factor) + solid_bg_rect.width() * lerp_factor,
+            outer_glow_rect.height() * (1.0 - lerp_factor) + solid_bg_rect.height() * lerp_factor
+        )
+
+        # Blend colors from RED_COLOR (outside, lerp_factor=0) to DARK_BG_COLOR (inside, lerp_factor=1)
+        current_red = int(red_color_base.red() * (1.0 - lerp_factor) + bg_color_base.red() * lerp_factor)
+        current_green = int(red_color_base.green() * (1.0 - lerp_factor) + bg_color_base.green() * lerp_factor)
+        current_blue = int(red_color_base.blue() * (1.0 - lerp_factor) + bg_color_base.blue() * lerp_factor)
+
+        # Calculate alpha fading from near-transparent at the outermost edge to
+        # the alpha of the background color at the innermost edge of the glow.
+        # This creates the merge effect with the background behind the overlay.
+        # Alpha goes from 0 (or a small start_alpha) to bg_color_base.alpha()
+        start_alpha = 0 # Start with full transparency at the outer edge
+        end_alpha = bg_color_base.alpha() # End with background color's alpha at the inner edge of glow band
+        current_alpha = int(start_alpha * (1.0 - lerp_factor) + end_alpha * lerp_factor)
+        current_alpha = min(255, max(0, current_alpha)) # Clamp alpha
+
+        # Create the color for the current layer
+        current_color = QColor(current_red, current_green, current_blue, current_alpha)
+
+        # Set pen color and thickness
+        painter.setPen(QPen(current_color, 1.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+
+        # Draw the rounded rectangle border for the current layer
+        painter.drawRoundedRect(current_rect, CORNER_RADIUS, CORNER_RADIUS)
+
+    # --- Draw the Solid Inner Background ---
+    painter.setPen(Qt.NoPen)
+    # Use a brush with the background color (including its alpha) for the solid fill
+    painter.setBrush(QBrush(bg_color_base))
+    painter.drawRoundedRect(solid_bg_rect, CORNER_RADIUS, CORNER_RADIUS)
+
+    painter.end()
+    return QPixmap.fromImage(image)
+
 class ClassifierOverlay(QWidget):
     exitOverlay = pyqtSignal()
 
+    # Shared by every overlay instance; built on first use since fonts need the QApplication
+    prediction_font = None
+    confidence_font = None
+
     def __init__(self, parent=None):
         super().__init__(parent, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        # paintEvent copies every dirty pixel from the cached background, so Qt
+        # doesn't need to fill anything first
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setAutoFillBackground(False)
         self.running = False
         self.prediction = "N/A"
         self.confidence = 0.0
+        self.last_is_basketball = None  # Class and text the labels currently show
+        self.last_confidence_text = None
+        # Predictions can arrive at the inference rate; the labels are refreshed
+        # at most every OVERLAY_REFRESH_INTERVAL ms with whichever came last
+        self.pending_prediction = None
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(OVERLAY_REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.apply_prediction)
+        self.background_pixmap = None
         self.resize(300, 160) # Keep size consistent
         self.init_ui()
         self.position_overlay()
@@ -57,82 +200,33 @@ class ClassifierOverlay(QWidget):
         self.layout.setContentsMargins(glow_margin, glow_margin, glow_margin, glow_margin)
         self.layout.setSpacing(6)
 
+        if ClassifierOverlay.prediction_font is None:
+            ClassifierOverlay.prediction_font = QFont("Arial", 10, QFont.Bold)
+            ClassifierOverlay.confidence_font = QFont("Arial", 9)
+
         # --- UI Elements (Labels, Buttons) - Keep consistent ---
         self.prediction_label = QLabel("N/A")
-        self.prediction_label.setFont(QFont("Arial", 10, QFont.Bold))
-        self.prediction_label.setStyleSheet(f"color: {LIGHT_TEXT_QCOLOR.name()}; background-color: transparent;")
+        self.prediction_label.setFont(self.prediction_font)
+        self.prediction_label.setStyleSheet(PREDICTION_LABEL_STYLE)
         self.prediction_label.setAlignment(Qt.AlignCenter)
 
         self.confidence_label = QLabel("0%")
-        self.confidence_label.setFont(QFont("Arial", 9))
-        self.confidence_label.setStyleSheet(f"color: {LIGHT_TEXT_QCOLOR.name()}; background-color: transparent;")
+        self.confidence_label.setFont(self.confidence_font)
+        self.confidence_label.setStyleSheet(LABEL_STYLE)
         self.confidence_label.setAlignment(Qt.AlignCenter)
 
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(25)
-
-        button_size = 45
-        button_radius = button_size / 2
-        button_border_color = RED_QCOLOR.name()
-        button_border_hover_qcolor = QColor(button_border_color)
-        button_border_hover_qcolor = button_border_hover_qcolor.lighter(140)
-        button_border_hover_qcolor.setHsv(button_border_hover_qcolor.hue(), max(0, int(button_border_hover_qcolor.saturation() * 0.7)), button_border_hover_qcolor.value())
-        button_border_hover_color = button_border_hover_qcolor.name()
-
-        button_bg_color = "#181818"
-        button_hover_bg_color = "#282828"
-        button_pressed_bg_color = "#383838"
+        self.setStyleSheet(BUTTON_STYLE)
 
         self.toggle_button = QPushButton()
-        self.toggle_button.setFixedSize(button_size, button_size)
-        play_pause_style = f"""
-            QPushButton {{
-                background-color: {button_bg_color};
-                color: {button_border_color};
-                border-radius: {button_radius}px;
-                border: 2px solid {button_border_color};
-                font-family: 'Arial';
-                font-size: 16px;
-                font-weight: bold;
-                text-align: center;
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {button_hover_bg_color};
-                border: 2px solid {button_border_hover_color};
-                color: {button_border_hover_color};
-            }}
-            QPushButton:pressed {{
-                background-color: {button_pressed_bg_color};
-            }}
-        """
-        self.toggle_button.setStyleSheet(play_pause_style)
+        self.toggle_button.setFixedSize(BUTTON_SIZE, BUTTON_SIZE)
         self.toggle_button.setText("▶")
         self.toggle_button.clicked.connect(self.toggle_capture)
 
         self.exit_button = QPushButton()
-        self.exit_button.setFixedSize(button_size, button_size)
-        exit_button_style = f"""
-            QPushButton {{
-                background-color: {button_bg_color};
-                color: {button_border_color};
-                border-radius: {button_radius}px;
-                border: 2px solid {button_border_color};
-                font-family: Arial;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {button_hover_bg_color};
-                border: 2px solid {button_border_hover_color};
-                color: {button_border_hover_color};
-            }}
-            QPushButton:pressed {{
-                background-color: {button_pressed_bg_color};
-            }}
-        """
-        self.exit_button.setStyleSheet(exit_button_style)
+        self.exit_button.setFixedSize(BUTTON_SIZE, BUTTON_SIZE)
+        self.exit_button.setObjectName("exitButton")
         self.exit_button.setText("×")
         self.exit_button.clicked.connect(self.exit_overlay_mode)
 
@@ -156,79 +250,22 @@ class ClassifierOverlay(QWidget):
              screen_geometry = QApplication.desktop().screenGeometry()
         self.move(screen_geometry.width() - self.width() - 20, 20)
 
+    def resizeEvent(self, event):
+        """Fetch the background for the new size."""
+        super().resizeEvent(event)
+        # Match the screen's pixel density so the cached background stays sharp
+        self.background_pixmap = render_background_pixmap(self.width(), self.height(), self.devicePixelRatioF())
+
     def paintEvent(self, event):
         """Paint event for background and the layered rounded rectangle glow."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-
-        # Define base colors
-        bg_color_base = QColor(DARK_BG_QCOLOR) # Use base color for blending
-        red_color_base = QColor(RED_QCOLOR)   # Use base color for blending
-
-        # Define geometry
-        corner_radius = 20.0
-        glow_extent = 5  # Reduced from 18 to 10 for thinner gradient
-
-        # Rectangles defining the glow region and the solid background region
-        solid_bg_rect = QRectF(self.rect()).adjusted(glow_extent, glow_extent, -glow_extent, -glow_extent)
-        outer_glow_rect = QRectF(self.rect())
-
-        # Ensure the solid background rectangle is valid
-        if solid_bg_rect.width() <= 0 or solid_bg_rect.height() <= 0:
-            print("Warning: Widget size too small for defined glow extent. Drawing solid background.")
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(bg_color_base)) # Use brush for solid fill
-            painter.drawRoundedRect(self.rect(), corner_radius, corner_radius)
+        if self.background_pixmap is None:
             return
-
-        # --- Draw the Layered Rounded Rectangle Gradient ---
-
-        num_glow_layers = 60 # Increased layers for smoother transition
-
-        # Iterate from the outer edge inwards
-        for i in range(num_glow_layers):
-            # Calculate the blending factor for this layer (0 at outer edge, 1 at inner edge of glow)
-            lerp_factor = i / (num_glow_layers - 1) if num_glow_layers > 1 else 0.0
-
-            # Calculate the current rectangle for this layer
-            current_rect = QRectF(
-                outer_glow_rect.left() * (1.0 - lerp_factor) + solid_bg_rect.left() * lerp_factor,
-                outer_glow_rect.top() * (1.0 - lerp_factor) + solid_bg_rect.top() * lerp_factor,
-                outer_glow_rect.width() * (1.0 - lerp_factor) + solid_bg_rect.width() * lerp_factor,
-                outer_glow_rect.height() * (1.0 - lerp_factor) + solid_bg_rect.height() * lerp_factor
-            )
-
-            # Blend colors from RED_COLOR (outside, lerp_factor=0) to DARK_BG_COLOR (inside, lerp_factor=1)
-            current_red = int(red_color_base.red() * (1.0 - lerp_factor) + bg_color_base.red() * lerp_factor)
-            current_green = int(red_color_base.green() * (1.0 - lerp_factor) + bg_color_base.green() * lerp_factor)
-            current_blue = int(red_color_base.blue() * (1.0 - lerp_factor) + bg_color_base.blue() * lerp_factor)
-
-            # Calculate alpha fading from near-transparent at the outermost edge to
-            # the alpha of the background color at the innermost edge of the glow.
-            # This creates the merge effect with the background behind the overlay.
-            # Alpha goes from 0 (or a small start_alpha) to bg_color_base.alpha()
-            start_alpha = 0 # Start with full transparency at the outer edge
-            end_alpha = bg_color_base.alpha() # End with background color's alpha at the inner edge of glow band
-            current_alpha = int(start_alpha * (1.0 - lerp_factor) + end_alpha * lerp_factor)
-            current_alpha = min(255, max(0, current_alpha)) # Clamp alpha
-
-            # Create the color for the current layer
-            current_color = QColor(current_red, current_green, current_blue, current_alpha)
-
-            # Set pen color and thickness
-            painter.setPen(QPen(current_color, 1.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-            painter.setBrush(Qt.NoBrush) # Don't fill the shape
-
-            # Draw the rounded rectangle border for the current layer
-            painter.drawRoundedRect(current_rect, corner_radius, corner_radius)
-
-        # --- Draw the Solid Inner Background ---
-        painter.setPen(Qt.NoPen)
-        # Use a brush with the background color (including its alpha) for the solid fill
-        painter.setBrush(QBrush(bg_color_base))
-        painter.drawRoundedRect(solid_bg_rect, corner_radius, corner_radius)
-
+        # The glow and background are one cached pixmap. The translucent backing store
+        # is cleared before painting and the painter is clipped to the dirty region,
+        # so a straight 1:1 copy touches exactly the pixels that need repainting
+        painter = QPainter(self)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.drawPixmap(0, 0, self.background_pixmap)
 
     def mousePressEvent(self, event):
         """Handle mouse press for dragging."""
@@ -249,26 +286,43 @@ class ClassifierOverlay(QWidget):
             self.toggle_button.setText("‖") # Pause symbol
         else:
             self.toggle_button.setText("▶") # Play symbol
-        self.update()
 
 
     def update_prediction(self, is_basketball, confidence):
+        """Queue a prediction; the labels pick up the latest one on the next refresh."""
+        self.pending_prediction = (is_basketball, confidence)
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+
+    def apply_prediction(self):
         """Update the prediction labels."""
+        if self.pending_prediction is None:
+            return
+        is_basketball, confidence = self.pending_prediction
+        self.pending_prediction = None
+
         if is_basketball:
             prediction_text = "BASKETBALL"
-            prediction_color = RED_QCOLOR.name()
             confidence_pct = confidence * 100
         else:
             prediction_text = "NOT BASKETBALL"
-            prediction_color = LIGHT_TEXT_QCOLOR.name()
             confidence_pct = (1 - confidence) * 100
+        confidence_text = f"{confidence_pct:.1f}%"
+
+        # The labels only change what they show at 0.1% resolution
+        if is_basketball == self.last_is_basketball and confidence_text == self.last_confidence_text:
+            return
 
-        self.prediction_label.setText(prediction_text)
-        self.prediction_label.setStyleSheet(f"color: {prediction_color}; font-weight: bold; background-color: transparent;")
+        # The style depends only on the class, so it is restyled only when the class flips
+        if is_basketball != self.last_is_basketball:
+            self.prediction_label.setText(prediction_text)
+            self.prediction_label.setProperty("prediction", "basketball" if is_basketball else "other")
+            self.prediction_label.style().unpolish(self.prediction_label)
+            self.prediction_label.style().polish(self.prediction_label)
+            self.last_is_basketball = is_basketball
 
-        self.confidence_label.setText(f"{confidence_pct:.1f}%")
-        self.confidence_label.setStyleSheet(f"color: {LIGHT_TEXT_QCOLOR.name()}; background-color: transparent;")
-        self.update()
+        self.confidence_label.setText(confidence_text)
+        self.last_confidence_text = confidence_text
 
 
     def exit_overlay_mode(self):
@@ -0,0 +1,24 @@
+"""
+Scene Change Detection for Basketball Classifier App
+Frames are compared as small gray thumbnails; only frames that differ enough
+from the previous one are sent to the model.
+"""
+
+import cv2
+
+SCENE_DETECT_SIZE = (64, 36)  # thumbnail size (w, h) compared for scene change detection
+
+# Mean absolute luminance difference between consecutive thumbnails that counts
+# as a scene change. Measured on 1920x1080 screen-like frames: hard cuts score
+# ~25 (cuts within the same layout ~14), 30% dims ~40, 40 px pans ~11.5,
+# 5 px pans and lower-third overlays ~2, pixel noise ~0.1
+SCENE_THRESHOLD = 12.0
+
+def scene_thumbnail(frame):
+    """Area-downsample a BGRA frame to the single-channel scene thumbnail"""
+    return cv2.cvtColor(cv2.resize(frame, SCENE_DETECT_SIZE, interpolation=cv2.INTER_AREA),
+                        cv2.COLOR_BGRA2GRAY)
+
+def scene_change(prev_thumbnail, thumbnail):
+    """Mean absolute luminance difference between two thumbnails, computed in one pass"""
+    return cv2.norm(prev_thumbnail, thumbnail, cv2.NORM_L1) / prev_thumbnail.size
@@ -3,7 +3,7 @@ Settings Dialog for Basketball Classifier App
 This file contains a dialog for adjusting application settings.
 """
 
-import psutil
+from functools import lru_cache
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
@@ -11,11 +11,25 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout,
 
 # Import styling
 from style import STYLE, RED_COLOR, LIGHT_TEXT_COLOR
+from scene import SCENE_THRESHOLD
+
+# How often the performance metrics refresh, in ms
+METRICS_INTERVAL = 2000
+
+@lru_cache(maxsize=None)
+def settings_font(size, weight=QFont.Normal):
+    """Shared Consolas font for the dialog; built on first use since fonts need the QApplication"""
+    return QFont("Consolas", size, weight)
+
+def set_text(label, text):
+    """Set a label's text only when it differs, so unchanged metrics don't repaint"""
+    if label.text() != text:
+        label.setText(text)
 
 class SettingsDialog(QDialog):
     """Dialog for adjusting application settings"""
     
-    def __init__(self, parent=None, scene_threshold=30.0, fps=0):
+    def __init__(self, parent=None, scene_threshold=SCENE_THRESHOLD, fps=0):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setMinimumWidth(700)
@@ -26,10 +40,16 @@ class SettingsDialog(QDialog):
         self.result_threshold = scene_threshold  # Store the result
         self.current_fps = fps
         
-        # Setup timer for updating metrics
+        # psutil is only needed once the dialog is opened, so it isn't imported at startup.
+        # The process handle is reused and cpu_percent primed, so each refresh
+        # only measures the time since the previous one
+        import psutil
+        self.process = psutil.Process()
+        psutil.cpu_percent(interval=None)
+        
+        # Setup timer for updating metrics, it only runs while the dialog is shown
         self.metrics_timer = QTimer(self)
         self.metrics_timer.timeout.connect(self.update_metrics)
-        self.metrics_timer.start(1000)  # Update every second
         
         self.init_ui()
         
@@ -40,7 +60,7 @@ class SettingsDialog(QDialog):
         
         # Title
         title_label = QLabel("Application Settings")
-        title_label.setFont(QFont("Consolas", 12, QFont.Bold))
+        title_label.setFont(settings_font(12, QFont.Bold))
         title_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title_label)
         
@@ -49,26 +69,26 @@ class SettingsDialog(QDialog):
         
         # Performance Metrics section
         metrics_group = QGroupBox("Performance Metrics")
-        metrics_group.setFont(QFont("Consolas", 10, QFont.Bold))
+        metrics_group.setFont(settings_font(10, QFont.Bold))
         metrics_layout = QGridLayout(metrics_group)
         
         # CPU Usage
         cpu_label = QLabel("CPU Usage:")
-        cpu_label.setFont(QFont("Consolas", 9))
+        cpu_label.setFont(settings_font(9))
         self.cpu_value = QLabel("0%")
-        self.cpu_value.setFont(QFont("Consolas", 9))
+        self.cpu_value.setFont(settings_font(9))
         
         # FPS
         fps_label = QLabel("FPS:")
-        fps_label.setFont(QFont("Consolas", 9))
+        fps_label.setFont(settings_font(9))
         self.fps_value = QLabel(f"{self.current_fps}")
-        self.fps_value.setFont(QFont("Consolas", 9))
+        self.fps_value.setFont(settings_font(9))
         
         # Memory usage
         memory_label = QLabel("Memory Usage:")
-        memory_label.setFont(QFont("Consolas", 9))
+        memory_label.setFont(settings_font(9))
         self.memory_value = QLabel("0 MB")
-        self.memory_value.setFont(QFont("Consolas", 9))
+        self.memory_value.setFont(settings_font(9))
         
         # Add to grid
         metrics_layout.addWidget(cpu_label, 0, 0)
@@ -86,22 +106,23 @@ class SettingsDialog(QDialog):
         
         # Scene sensitivity control
         scene_group = QGroupBox("Capture Settings")
-        scene_group.setFont(QFont("Consolas", 10, QFont.Bold))
+        scene_group.setFont(settings_font(10, QFont.Bold))
         scene_layout = QVBoxLayout(scene_group)
         
         # Label and value
         scene_header = QHBoxLayout()
         scene_label = QLabel("Scene Sensitivity:")
-        scene_label.setFont(QFont("Consolas", 9))
+        scene_label.setFont(settings_font(9))
         self.value_label = QLabel(f"{self.scene_threshold:.1f}")
-        self.value_label.setFont(QFont("Consolas", 9))
+        self.value_label.setFont(settings_font(9))
         scene_header.addWidget(scene_label)
         scene_header.addStretch()
         scene_header.addWidget(self.value_label)
         
         # Slider
         self.scene_slider = QSlider(Qt.Horizontal)
-        self.scene_slider.setRange(1, 80)
+        # Thumbnail luminance differences: hard cuts score ~25, small pans and overlays < 5
+        self.scene_slider.setRange(1, 40)
         self.scene_slider.setValue(int(self.scene_threshold))
         self.scene_slider.valueChanged.connect(self.update_threshold)
         
@@ -139,26 +160,32 @@ class SettingsDialog(QDialog):
     
     def update_metrics(self):
         """Update the performance metrics"""
-        # CPU usage
-        cpu_percent = psutil.cpu_percent()
-        self.cpu_value.setText(f"{cpu_percent:.1f}%")
+        import psutil  # Already loaded by __init__, this is just a lookup
+        
+        # CPU usage since the last refresh
+        cpu_percent = psutil.cpu_percent(interval=None)
+        set_text(self.cpu_value, f"{cpu_percent:.1f}%")
         
         # Update FPS from main app if available
         if hasattr(self.parent, 'fps'):
             self.current_fps = self.parent.fps
-            self.fps_value.setText(f"{self.current_fps}")
+            set_text(self.fps_value, f"{self.current_fps}")
         
         # Memory usage
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        memory_info = self.process.memory_info()
         memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
-        self.memory_value.setText(f"{memory_mb:.1f} MB")
+        set_text(self.memory_value, f"{memory_mb:.1f} MB")
     
     def get_threshold(self):
         """Return the selected threshold value"""
         return self.result_threshold
         
-    def closeEvent(self, event):
-        """Stop timer when dialog is closed"""
+    def showEvent(self, event):
+        """Start updating metrics when the dialog is shown"""
+        self.metrics_timer.start(METRICS_INTERVAL)
+        super().showEvent(event)
+        
+    def hideEvent(self, event):
+        """Stop timer when dialog is hidden, closed or minimized"""
         self.metrics_timer.stop()
-        super().closeEvent(event) 
\ No newline at end of file
+        super().hideEvent(event) 
\ No newline at end of file
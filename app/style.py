@@ -20,6 +20,10 @@ QLabel {
     font-size: 9pt;
 }
 
+QLabel[prediction="basketball"] {
+    color: #ff3e3e;
+}
+
 QPushButton {
     background-color: #1e1e1e;
     color: #ff3e3e;
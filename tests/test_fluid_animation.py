@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "app"))
+
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from fluid_animation import FluidAnimation
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_update_animation_grows_and_paints_curves(app):
+    widget = FluidAnimation()
+    widget.resize(400, 300)
+    widget.start_animation()
+
+    grown = 0
+    for _ in range(120):
+        widget.update_animation()
+        grown += sum(1 for curve in widget.curves if not curve.growth_complete)
+        widget.grab()  # runs paintEvent, drawing the partly grown curves
+
+    assert widget.curves
+    assert grown > 0
+    widget.stop_animation()
+
+
+def test_start_animation_under_hidden_parent_keeps_timer_stopped(app):
+    parent = QWidget()
+    widget = FluidAnimation(parent)
+    widget.resize(400, 300)
+    widget.show()  # parent stays hidden, so the widget is not visible
+    widget.start_animation()
+
+    assert not widget.isVisible()
+    assert not widget.animation_timer.isActive()
+
+    parent.show()
+    assert widget.animation_timer.isActive()
+    widget.stop_animation()
@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "app"))
+
+from scene import SCENE_THRESHOLD, scene_change, scene_thumbnail
+
+WIDTH, HEIGHT = 675, 380  # display frame size for a 1920x1080 capture
+
+
+def screen_like(rng):
+    """Multi-scale noise with solid boxes and text, roughly the statistics of a screen"""
+    img = np.zeros((HEIGHT, WIDTH, 3), np.float32)
+    for scale in (2, 6, 22, 90):
+        noise = rng.random((HEIGHT // scale + 2, WIDTH // scale + 2, 3)).astype(np.float32)
+        img += cv2.resize(noise, (WIDTH + 2 * scale, HEIGHT + 2 * scale),
+                          interpolation=cv2.INTER_CUBIC)[:HEIGHT, :WIDTH] * (255 / 4)
+    img = np.clip(img, 0, 255).astype(np.uint8)
+    for _ in range(12):
+        x, y = int(rng.integers(0, WIDTH - 70)), int(rng.integers(0, HEIGHT - 35))
+        colour = tuple(int(c) for c in rng.integers(0, 255, 3))
+        cv2.rectangle(img, (x, y), (x + int(rng.integers(20, 140)), y + int(rng.integers(8, 70))), colour, -1)
+    for _ in range(20):
+        cv2.putText(img, "SCORE 102-99 Q4", (int(rng.integers(0, WIDTH - 100)), int(rng.integers(10, HEIGHT))),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+    return cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+
+
+def score(a, b):
+    return scene_change(scene_thumbnail(a), scene_thumbnail(b))
+
+
+@pytest.fixture(scope="module")
+def frames():
+    rng = np.random.default_rng(0)
+    return [screen_like(rng) for _ in range(4)], rng
+
+
+def test_cuts_and_dims_are_scene_changes(frames):
+    scenes, _ = frames
+    for a, b in zip(scenes, scenes[1:]):
+        assert score(a, b) > SCENE_THRESHOLD
+        assert score(a, (a * 0.7).astype(np.uint8)) > SCENE_THRESHOLD
+
+
+def test_small_changes_are_not_scene_changes(frames):
+    scenes, rng = frames
+    for a, other in zip(scenes, scenes[1:]):
+        pan = np.roll(a, 2, axis=1)
+        overlay = a.copy()
+        overlay[-70:, :WIDTH // 2] = other[-70:, :WIDTH // 2]
+        noise = np.clip(a.astype(np.int16) + rng.integers(-6, 7, a.shape), 0, 255).astype(np.uint8)
+        for changed in (a, pan, overlay, noise):
+            assert score(a, changed) < SCENE_THRESHOLD